@@ -18,9 +18,12 @@ Usage:
 from __future__ import annotations
 
 import queue
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from loguru import logger
+
 
 @dataclass
 class AgentMiddleware:
@@ -30,21 +33,23 @@ class AgentMiddleware:
     log_queue: queue.Queue | None = None
     _token_records: list[dict] = field(default_factory=list)
     _tool_calls: list[str] = field(default_factory=list)
+    _started_at: float | None = None
 
     # ── Logging ───────────────────────────────────────────────────────
 
     def emit(self, message: str) -> None:
-        """Push a log message to the shared queue and stdout."""
+        """Push a log message to the shared queue and the logger."""
         if self.log_queue is not None:
             try:
                 self.log_queue.put_nowait(message)
             except queue.Full:
                 pass
-        print(f"   {message}")
+        logger.bind(agent=self.agent_name).info(message)
 
     # ── Lifecycle hooks ───────────────────────────────────────────────
 
     def on_start(self, label: str | None = None) -> None:
+        self._started_at = time.perf_counter()
         self.emit(f"{'🌍' if 'geo' in self.agent_name else '💳' if 'credit' in self.agent_name else '📊'} {label or self.agent_name} starting...")
 
     def on_iteration(self, iteration: int, max_iterations: int) -> None:
@@ -67,7 +72,7 @@ class AgentMiddleware:
 
     def on_done(self) -> None:
         s = self.summary()
-        self.emit(f"✅ {self.agent_name} done — {s['input']:,} in / {s['output']:,} out")
+        self.emit(f"✅ {self.agent_name} done in {s['seconds']:.1f}s — {s['input']:,} in / {s['output']:,} out")
 
     def on_structured_report(self, entity: str, score: int, rating: str) -> None:
         self.emit(f"📋 Structured: {entity} — {score}/100 [{rating}]")
@@ -79,11 +84,13 @@ class AgentMiddleware:
         total_in = sum(t["input_tokens"] for t in self._token_records)
         total_out = sum(t["output_tokens"] for t in self._token_records)
         total_cached = sum(t["cached_tokens"] for t in self._token_records)
+        seconds = time.perf_counter() - self._started_at if self._started_at is not None else 0.0
         return {
             "agent": self.agent_name,
             "input": total_in,
             "output": total_out,
             "cached": total_cached,
+            "seconds": round(seconds, 1),
             "tool_calls": list(self._tool_calls),
             "num_tool_calls": len(self._tool_calls),
             "num_llm_calls": len(self._token_records),
@@ -11,9 +11,12 @@ from pydantic import BaseModel, Field
 import uvicorn
 from loguru import logger
 
-from src.main import run_analysis
+from src.main import run_analysis_stream
 from src.agents.nodes import set_log_queue
 from src.infrastructure.observability.langfuse_tracer import get_langfuse_handler, shutdown_langfuse
+from src.infrastructure.observability.log_sink import configure_logging
+from src.infrastructure.persistence.redis import close_redis_saver
+from src.infrastructure.persistence.sqlite import close_sqlite_saver
 import src.db as db
 
 # ── WebSocket Manager for Live Logs ──────────────────────────────────
@@ -60,10 +63,13 @@ async def log_broadcaster():
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
+    configure_logging()
     db.init_db()
     asyncio.create_task(log_broadcaster())
     logger.info("FastAPI Server Started - Log broadcaster running.")
     yield
+    await close_redis_saver()
+    await close_sqlite_saver()
     shutdown_langfuse()
     logger.info("Langfuse flushed — shutdown complete.")
 
@@ -117,7 +123,8 @@ async def analyze(req: AnalyzeRequest):
     """
     Run a full multi-agent risk analysis.
     Blocking — waits for the LangGraph pipeline to finish.
-    For live updates connect to /api/ws/stream WebSocket.
+    For live updates connect to /api/ws/stream WebSocket: a status message
+    carrying a ``stage`` field is broadcast as each graph node completes.
     """
     os.environ["OLLAMA_MODEL"] = req.model
     thread_id = str(uuid.uuid4())
@@ -133,21 +140,46 @@ async def analyze(req: AnalyzeRequest):
     start_time = time.time()
 
     try:
-        report, sources, token_usage, structured_report = await run_analysis(
+        result: dict | None = None
+        async for event in run_analysis_stream(
             query=req.query,
             use_redis=req.use_redis,
             thread_id=thread_id,
             langfuse_handler=langfuse_handler,
-        )
-
+            # Throwaway uuid thread: never resumed, so keep checkpoints in memory
+            resume=False,
+        ):
+            if event["type"] == "node":
+                took = f" in {event['seconds']:.1f}s" if event["seconds"] is not None else ""
+                await manager.broadcast({
+                    "type": "status",
+                    "message": f"[{event['elapsed']:.1f}s] {event['node']} done{took}",
+                    "stage": event["node"],
+                    "seconds": event["seconds"],
+                    "thread_id": thread_id,
+                })
+            elif event["type"] == "result":
+                result = event
+        if result is None:
+            raise RuntimeError("Analysis stream ended without a result")
+        report = result["report"]
+        sources = result["sources"]
+        token_usage = result["token_usage"]
+        structured_report = result["structured_report"]
+
+        # A result-cache hit was already saved by the run that produced it:
+        # point the response at that report instead of adding a duplicate row
+        if result.get("cached"):
+            thread_id = result.get("thread_id") or thread_id
         try:
-            db.save_report(
-                report_id=thread_id,
-                entity=req.query[:50],
-                scores={"overall": 0, "geopolitical": 0, "credit": 0, "market": 0, "esg": 0},
-                report_text=report,
-                sources=sources,
-            )
+            if not result.get("cached"):
+                db.save_report(
+                    report_id=thread_id,
+                    entity=req.query[:50],
+                    scores={"overall": 0, "geopolitical": 0, "credit": 0, "market": 0, "esg": 0},
+                    report_text=report,
+                    sources=sources,
+                )
         except Exception as e:
             logger.error(f"Failed to save report to DB: {e}")
 
@@ -7,7 +7,9 @@ message management, middleware hooks.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
 import queue
 from typing import Any
 
@@ -18,6 +20,16 @@ from src.domain.services.report_builder import extract_text
 from src.utils import retry_with_backoff
 
 
+# ── LLM concurrency bound (analysts run in parallel) ─────────────────
+_llm_semaphore = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "2")))
+
+
+async def _ainvoke_bounded(llm: Any, messages: list) -> Any:
+    """Invoke the LLM holding a concurrency slot (released during backoff sleeps)."""
+    async with _llm_semaphore:
+        return await llm.ainvoke(messages)
+
+
 # ── Tool dispatch (populated by container) ──────────────────────────
 TOOL_REGISTRY: dict[str, Any] = {}
 
@@ -27,26 +39,51 @@ def register_tools(tools: dict[str, Any]) -> None:
     TOOL_REGISTRY.update(tools)
 
 
-async def execute_tool_calls(tool_calls: list[dict], mw: AgentMiddleware) -> list[ToolMessage]:
-    """Execute tool calls and return ToolMessages."""
-    messages = []
-    for tool_call in tool_calls:
-        tool_name = tool_call["name"]
-        tool_args = tool_call["args"]
-        tool_fn = TOOL_REGISTRY.get(tool_name)
+async def _invoke_tool(tool_name: str, tool_args: dict) -> Any:
+    tool_fn = TOOL_REGISTRY.get(tool_name)
+    if not tool_fn:
+        return json.dumps({"error": f"Unknown tool: {tool_name}"})
+    try:
+        return await tool_fn.ainvoke(tool_args)
+    except Exception as e:
+        return json.dumps({"error": f"Tool {tool_name} failed: {str(e)}"})
+
+
+def _to_content(result: Any) -> str:
+    """Tool output as message content — JSON for structured results, never repr()."""
+    if isinstance(result, str):
+        return result
+    if isinstance(result, (dict, list)):
+        return json.dumps(result, default=str)
+    return str(result)
 
-        mw.on_tool_call(tool_name)
 
-        if tool_fn:
-            try:
-                result = await tool_fn.ainvoke(tool_args)
-            except Exception as e:
-                result = json.dumps({"error": f"Tool {tool_name} failed: {str(e)}"})
-        else:
-            result = json.dumps({"error": f"Unknown tool: {tool_name}"})
+def tool_call_key(tool_call: dict) -> str:
+    """Canonical identity of a tool call: name + sorted JSON arguments."""
+    return f"{tool_call['name']}:{json.dumps(tool_call['args'], sort_keys=True, default=str)}"
 
-        messages.append(ToolMessage(content=str(result), tool_call_id=tool_call["id"]))
-    return messages
+
+async def execute_tool_calls(tool_calls: list[dict], mw: AgentMiddleware) -> list[ToolMessage]:
+    """Execute tool calls concurrently and return ToolMessages in call order.
+
+    Identical calls (same name and arguments) within one step run once and
+    their result is fanned out to every matching tool_call_id.
+    """
+    unique: dict[str, dict] = {}
+    for tool_call in tool_calls:
+        key = tool_call_key(tool_call)
+        if key not in unique:
+            unique[key] = tool_call
+            mw.on_tool_call(tool_call["name"])
+
+    results = await asyncio.gather(
+        *(_invoke_tool(tool_call["name"], tool_call["args"]) for tool_call in unique.values())
+    )
+    by_key = dict(zip(unique, results))
+    return [
+        ToolMessage(content=_to_content(by_key[tool_call_key(tool_call)]), tool_call_id=tool_call["id"])
+        for tool_call in tool_calls
+    ]
 
 
 def prune_messages(messages: list) -> list:
@@ -68,14 +105,17 @@ async def run_react_loop(
     max_iterations: int = 6,
 ) -> tuple[str, list, list[dict]]:
     """Run the ReAct reasoning loop with retry on rate limits."""
-    messages = [SystemMessage(content=system_prompt)] + list(state_messages)
+    messages: list[Any] = [SystemMessage(content=system_prompt)]
+    messages.extend(state_messages)
     loop_messages: list[Any] = []
 
     response = None
+    seen_calls: set[str] = set()
     for iteration in range(max_iterations):
         mw.on_iteration(iteration + 1, max_iterations)
         response = await retry_with_backoff(
-            llm_with_tools.ainvoke,
+            _ainvoke_bounded,
+            llm_with_tools,
             messages,
             max_retries=5,
             base_delay=15.0,
@@ -89,6 +129,17 @@ async def run_react_loop(
             mw.on_final_response()
             break
 
+        # Stuck agent: every requested call was already answered in an earlier step.
+        # Keep only the text so no unanswered tool_calls leak into the graph state.
+        call_keys = {tool_call_key(tool_call) for tool_call in response.tool_calls}
+        if call_keys <= seen_calls:
+            mw.emit("🔁 Repeated tool calls — stopping early")
+            response = AIMessage(content=response.content)
+            messages[-1] = response
+            loop_messages[-1] = response
+            break
+        seen_calls |= call_keys
+
         tool_messages = await execute_tool_calls(response.tool_calls, mw)
         messages.extend(tool_messages)
         loop_messages.extend(tool_messages)
@@ -96,7 +147,9 @@ async def run_react_loop(
     final_text = extract_text(response.content) if response else ""
 
     if not final_text.strip() and len(messages) > 1:
-        for msg in reversed(messages[:-1]):
+        # Index-based reverse scan: no slice copy of the (long) message list
+        for i in range(len(messages) - 2, -1, -1):
+            msg = messages[i]
             if hasattr(msg, "content") and not getattr(msg, "tool_calls", None):
                 candidate = extract_text(msg.content)
                 if candidate.strip() and len(candidate.strip()) > 50:
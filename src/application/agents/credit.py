@@ -44,6 +44,6 @@ async def credit_evaluator_node(state: AgentState) -> dict[str, Any]:
     return {
         "messages": [AIMessage(content=f"[CREDIT RISK EVALUATOR]\n\n{final_content}", name="credit_evaluator")] + new_messages,
         "risk_signals": [{"agent": "credit_evaluator", "analysis": final_content}],
-        "iteration_count": state.get("iteration_count", 0) + 1,
-        "token_usage": [{"agent": s["agent"], "input": s["input"], "output": s["output"], "cached": s["cached"]}],
+        "iteration_count": 1,
+        "token_usage": [{"agent": s["agent"], "input": s["input"], "output": s["output"], "cached": s["cached"], "seconds": s["seconds"]}],
     }
@@ -45,6 +45,6 @@ async def geopolitical_analyst_node(state: AgentState) -> dict[str, Any]:
     return {
         "messages": [AIMessage(content=f"[GEOPOLITICAL ANALYST]\n\n{final_content}", name="geopolitical_analyst")] + new_messages,
         "risk_signals": [{"agent": "geopolitical_analyst", "analysis": final_content}],
-        "iteration_count": state.get("iteration_count", 0) + 1,
-        "token_usage": [{"agent": s["agent"], "input": s["input"], "output": s["output"], "cached": s["cached"]}],
+        "iteration_count": 1,
+        "token_usage": [{"agent": s["agent"], "input": s["input"], "output": s["output"], "cached": s["cached"], "seconds": s["seconds"]}],
     }
@@ -36,14 +36,18 @@ async def market_synthesizer_node(state: AgentState) -> dict[str, Any]:
     llm = create_llm(temperature=0.15, num_predict=8192)
     llm_with_tools = llm.bind_tools(_tools)
 
+    # Static skill text first, per-run content last: keeps the long prompt
+    # prefix byte-identical across days so provider prefix caching can hit.
     today = datetime.now().strftime("%Y-%m-%d")
-    formatted_prompt = get_skill_prompt("market-synthesizer", today=today)
+    formatted_prompt = get_skill_prompt("market-synthesizer")
 
     if _memory_adapter:
         memory = _memory_adapter.load()
         if memory.strip():
             formatted_prompt += f"\n\n## Previous Analyses (Memory)\n{memory}"
 
+    formatted_prompt += f"\n\n**Today's date is {today}.** Use it as the DATE in the report header."
+
     final_content, new_messages, _ = await run_react_loop(
         llm_with_tools=llm_with_tools,
         system_prompt=formatted_prompt,
@@ -67,6 +71,6 @@ async def market_synthesizer_node(state: AgentState) -> dict[str, Any]:
         "risk_signals": [{"agent": "market_synthesizer", "analysis": final_content}],
         "final_report": final_content,
         "structured_report": structured.model_dump(),
-        "iteration_count": state.get("iteration_count", 0) + 1,
-        "token_usage": [{"agent": s["agent"], "input": s["input"], "output": s["output"], "cached": s["cached"]}],
+        "iteration_count": 1,
+        "token_usage": [{"agent": s["agent"], "input": s["input"], "output": s["output"], "cached": s["cached"], "seconds": s["seconds"]}],
     }
@@ -20,5 +20,6 @@ class AgentState(TypedDict):
     risk_signals: Annotated[list[dict], operator.add]
     final_report: str
     structured_report: Optional[dict]
-    iteration_count: int
+    iteration_count: Annotated[int, operator.add]  # nodes return a delta (parallel-safe)
     token_usage: Annotated[list[dict], operator.add]
+    allow_self_correction: bool
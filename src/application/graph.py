@@ -6,6 +6,7 @@ Composes the multi-agent workflow with conditional routing.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from langgraph.graph import END, StateGraph
@@ -14,18 +15,22 @@ from src.application.dto import AgentState
 from src.application.agents.geopolitical import geopolitical_analyst_node
 from src.application.agents.credit import credit_evaluator_node
 from src.application.agents.synthesizer import market_synthesizer_node
-from src.application.supervisor import supervisor_node
+from src.application.supervisor import ANALYST_AGENTS, PARALLEL_ANALYSTS, supervisor_node
 
 
-def _route_supervisor(state: AgentState) -> str:
+def _route_supervisor(state: AgentState) -> str | list[str]:
     next_agent = state.get("next_agent", "FINISH")
     if next_agent == "FINISH":
         return "end"
+    if next_agent == PARALLEL_ANALYSTS:
+        # Fan-out: both analysts run in the same superstep and join back at the supervisor
+        return list(ANALYST_AGENTS)
     return next_agent
 
 
-def build_graph(checkpointer=None) -> Any:
-    """Build and compile the multi-agent LangGraph."""
+@lru_cache(maxsize=1)
+def _build_workflow() -> StateGraph:
+    """Declare the workflow topology once; each run only compiles it."""
     workflow = StateGraph(AgentState)
 
     workflow.add_node("supervisor", supervisor_node)
@@ -49,9 +54,17 @@ def build_graph(checkpointer=None) -> Any:
     workflow.add_edge("geopolitical_analyst", "supervisor")
     workflow.add_edge("credit_evaluator", "supervisor")
     workflow.add_edge("market_synthesizer", "supervisor")
+    return workflow
+
+
+def build_graph(checkpointer=None) -> Any:
+    """Build and compile the multi-agent LangGraph.
 
+    The topology is shared across calls; only the compiled graph (bound to
+    this run's checkpointer) is new.
+    """
     compile_kwargs = {}
     if checkpointer is not None:
         compile_kwargs["checkpointer"] = checkpointer
 
-    return workflow.compile(**compile_kwargs)
+    return _build_workflow().compile(**compile_kwargs)
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+import re
+from itertools import combinations
 from typing import Any
 
 from langchain_core.messages import SystemMessage
@@ -14,9 +16,60 @@ from src.infrastructure.llm.factory import create_llm
 from src.infrastructure.skills.loader import load_skill
 from src.utils import retry_with_backoff
 
-REQUIRED_PIPELINE = ["geopolitical_analyst", "credit_evaluator", "market_synthesizer"]
+# Independent analysts — fanned out together, both feed the synthesizer
+ANALYST_AGENTS = ("geopolitical_analyst", "credit_evaluator")
+PARALLEL_ANALYSTS = "parallel_analysts"
+REQUIRED_PIPELINE = [*ANALYST_AGENTS, "market_synthesizer"]
 AGENT_OPTIONS = REQUIRED_PIPELINE + ["FINISH"]
 
+# Flat JSON object carrying the routing decision; tolerates code fences/prose
+_JSON_RE = re.compile(r'\{[^{}]*"next"[^{}]*\}', re.DOTALL)
+_NEXT_FIELD_RE = re.compile(r'"next"\s*:\s*"(\w+)"')
+_AGENT_OPTION_NEEDLES = tuple((option, option.lower()) for option in AGENT_OPTIONS)
+
+
+def _build_routing_table() -> dict[frozenset[str], str]:
+    """Precompute the deterministic route for every incomplete set of reports.
+
+    The analysts fan out together until one of them has reported; after that
+    the first missing agent in pipeline order runs next.
+    """
+    table: dict[frozenset[str], str] = {}
+    for size in range(len(REQUIRED_PIPELINE)):
+        for reported in combinations(REQUIRED_PIPELINE, size):
+            if not any(agent in reported for agent in ANALYST_AGENTS):
+                table[frozenset(reported)] = PARALLEL_ANALYSTS
+            else:
+                table[frozenset(reported)] = next(a for a in REQUIRED_PIPELINE if a not in reported)
+    return table
+
+
+_PIPELINE_AGENTS = frozenset(REQUIRED_PIPELINE)
+_ROUTING_TABLE = _build_routing_table()
+
+# Per-report cap for the self-correction prompt — enough to judge depth
+_MAX_REPORT_CHARS = 4000
+
+
+async def _stream_decision(llm: Any, messages: list[Any]) -> str:
+    """Stream the evaluation and stop as soon as a valid "next" field appears.
+
+    The skill asks for "next" before "reasoning", so the routing decision is
+    usually complete after the first few tokens; closing the stream there
+    skips generating the rest of the reasoning.
+    """
+    buf = ""
+    stream = llm.astream(messages)
+    try:
+        async for chunk in stream:
+            buf += extract_text(chunk.content)
+            match = _NEXT_FIELD_RE.search(buf)
+            if match and match.group(1) in AGENT_OPTIONS:
+                return match.group(0).join("{}")
+    finally:
+        await stream.aclose()
+    return buf
+
 
 async def supervisor_node(state: AgentState) -> dict[str, Any]:
     """Supervisor — decides which specialist to invoke next."""
@@ -25,20 +78,36 @@ async def supervisor_node(state: AgentState) -> dict[str, Any]:
         logger.warning("Max iterations reached — finishing.")
         return {"next_agent": "FINISH"}
 
-    agents_reported = [s.get("agent") for s in state.get("risk_signals", [])]
-
-    # Deterministic routing: enforce pipeline order
-    for agent in REQUIRED_PIPELINE:
-        if agent not in agents_reported:
-            logger.info(f"Supervisor: routing to {agent} (pipeline order)")
-            return {"next_agent": agent}
+    signals = state.get("risk_signals") or ()
+    agents_reported = frozenset(s.get("agent") for s in signals) & _PIPELINE_AGENTS
+
+    # Deterministic routing: run the analysts concurrently, then the rest in order
+    next_agent = _ROUTING_TABLE.get(agents_reported)
+    if next_agent == PARALLEL_ANALYSTS:
+        logger.info(f"Supervisor: fanning out to {', '.join(ANALYST_AGENTS)} (parallel)")
+        return {"next_agent": next_agent}
+    if next_agent is not None:
+        logger.info(f"Supervisor: routing to {next_agent} (pipeline order)")
+        return {"next_agent": next_agent}
+
+    # The synthesizer just delivered the final report: FINISH is the only valid
+    # outcome unless the LLM self-correction pass is explicitly enabled.
+    if signals and signals[-1].get("agent") == "market_synthesizer" and not state.get("allow_self_correction", False):
+        logger.info("Supervisor: final report delivered — finishing.")
+        return {"next_agent": "FINISH"}
 
     # All agents reported → evaluate for self-correction
     llm = create_llm(temperature=0.0, num_predict=512)
 
+    # Only the latest report per agent, truncated: the routing decision needs
+    # the gist of each report, not every revision in full.
+    latest: dict[str, str] = {}
+    for signal in signals:
+        latest[signal.get("agent", "UNKNOWN")] = signal.get("analysis", "")
     reports_context = "\n\n".join(
-        f"--- REPORT FROM: {signal.get('agent', 'UNKNOWN')} ---\n{signal.get('analysis', '')}"
-        for signal in state.get("risk_signals", [])
+        f"--- REPORT FROM: {agent} ---\n{analysis[:_MAX_REPORT_CHARS]}"
+        + ("\n[... truncated]" if len(analysis) > _MAX_REPORT_CHARS else "")
+        for agent, analysis in latest.items()
     )
 
     supervisor_skill = load_skill("supervisor")
@@ -57,26 +126,24 @@ Here are the final synthesized reports from your team:
     logger.info("Supervisor evaluating completion based on final reports...")
 
     try:
-        response = await retry_with_backoff(llm.ainvoke, messages, max_retries=3, base_delay=5.0)
-        content = extract_text(response.content).strip()
+        content = (await retry_with_backoff(_stream_decision, llm, messages, max_retries=3, base_delay=5.0)).strip()
     except Exception as e:
         logger.error(f"Supervisor evaluation failed ({e}). Defaulting to FINISH.")
         return {"next_agent": "FINISH"}
 
     next_agent = "FINISH"
     try:
-        if "{" in content:
-            json_str = content[content.index("{"):content.rindex("}") + 1]
-            decision = json.loads(json_str)
-            candidate = decision.get("next", "FINISH")
-            if candidate in AGENT_OPTIONS:
-                next_agent = candidate
-            logger.debug(f"Supervisor reasoning: {decision.get('reasoning', 'None')}")
+        match = _JSON_RE.search(content)
+        if match is None:
+            raise ValueError("no routing JSON in supervisor response")
+        decision = json.loads(match.group(0))
+        candidate = decision.get("next", "FINISH")
+        if candidate in AGENT_OPTIONS:
+            next_agent = candidate
+        logger.debug(f"Supervisor reasoning: {decision.get('reasoning', 'None')}")
     except (json.JSONDecodeError, ValueError):
-        for option in AGENT_OPTIONS:
-            if option.lower() in content.lower():
-                next_agent = option
-                break
+        lowered = content.lower()
+        next_agent = next((option for option, needle in _AGENT_OPTION_NEEDLES if needle in lowered), "FINISH")
 
     logger.info(f"Supervisor decision: {next_agent}")
     return {"next_agent": next_agent}
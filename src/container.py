@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import os
 import queue
+import threading
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.tools import tool
@@ -21,9 +23,12 @@ from pydantic import BaseModel, Field
 from src.infrastructure.config.providers import get_embedding_config, get_vector_store_config, get_retrieval_config
 from src.infrastructure.embeddings.factory import create_embeddings
 from src.infrastructure.retrieval.hybrid import HybridRetriever
+from src.infrastructure.retrieval.semantic_cache import SemanticQueryCache
+from src.infrastructure.vector_store.pdf_loader import BROAD_MACRO_SCOPE, company_scope
 from src.infrastructure.data_sources.yahoo_finance import YahooFinanceAdapter
 from src.infrastructure.data_sources.duckduckgo import DuckDuckGoAdapter
 from src.infrastructure.persistence.memory import FileMemoryAdapter
+from src.infrastructure.persistence.tool_cache import DiskToolCache
 
 # ── Resolve project paths ──────────────────────────────────────────
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
@@ -32,6 +37,12 @@ _DB_PATH = os.path.join(_DATA_DIR, "risk_history.db")
 _CHROMA_DIR = os.path.join(_DATA_DIR, "chroma_db")
 _DOCS_DIR = os.path.join(_DATA_DIR, "docs")
 _MEMORY_PATH = os.path.join(_DATA_DIR, "AGENTS.md")
+_TOOL_CACHE_DIR = os.path.join(_DATA_DIR, "cache", "tools")
+
+# Tool result freshness (seconds)
+_MARKET_DATA_TTL = 3600
+_NEWS_TTL = 900
+_DISCLOSURES_TTL = 86400
 
 # ── Singleton adapters (lazily initialized) ─────────────────────────
 _report_repo: Any = None
@@ -40,6 +51,8 @@ _memory_adapter: FileMemoryAdapter | None = None
 _market_adapter: YahooFinanceAdapter | None = None
 _news_adapter: DuckDuckGoAdapter | None = None
 _hybrid_retriever: HybridRetriever | None = None
+_tool_cache: DiskToolCache | None = None
+_retriever_lock = threading.Lock()
 _bootstrapped = False
 
 
@@ -93,36 +106,58 @@ def get_news_adapter() -> DuckDuckGoAdapter:
     return _news_adapter
 
 
+def get_tool_cache() -> DiskToolCache:
+    global _tool_cache
+    if _tool_cache is None:
+        # Nothing is fresh beyond the longest TTL: sweep older entries once per process
+        _tool_cache = DiskToolCache(
+            _TOOL_CACHE_DIR, max_age=max(_MARKET_DATA_TTL, _NEWS_TTL, _DISCLOSURES_TTL),
+        )
+    return _tool_cache
+
+
 def get_hybrid_retriever() -> HybridRetriever:
     global _hybrid_retriever
-    if _hybrid_retriever is None:
-        vs_config = get_vector_store_config()
-        ret_config = get_retrieval_config()
+    if _hybrid_retriever is not None:
+        return _hybrid_retriever
+    # Parallel agents hit this together; build (and load the model) once
+    with _retriever_lock:
+        if _hybrid_retriever is None:
+            _hybrid_retriever = _build_hybrid_retriever()
+    return _hybrid_retriever
 
-        embedding = create_embeddings()
 
-        if _use_postgres():
-            from src.infrastructure.vector_store.pgvector import PgVectorStoreAdapter
-            vector_store = PgVectorStoreAdapter(
-                embedding=embedding,
-                table_name=vs_config.get("collection_name", "corporate_disclosures"),
-                docs_directory=_DOCS_DIR,
-            )
-        else:
-            from src.infrastructure.vector_store.chroma import ChromaVectorStoreAdapter
-            vector_store = ChromaVectorStoreAdapter(
-                embedding=embedding,
-                persist_directory=vs_config.get("persist_directory", _CHROMA_DIR),
-                collection_name=vs_config.get("collection_name", "corporate_disclosures"),
-                docs_directory=_DOCS_DIR,
-            )
-        _hybrid_retriever = HybridRetriever(
-            vector_store=vector_store,
-            vector_weight=ret_config.get("vector_weight", 0.6),
-            bm25_weight=ret_config.get("bm25_weight", 0.4),
-            rrf_k=ret_config.get("rrf_k", 60),
+def _build_hybrid_retriever() -> HybridRetriever:
+    vs_config = get_vector_store_config()
+    ret_config = get_retrieval_config()
+
+    embedding = create_embeddings()
+
+    if _use_postgres():
+        from src.infrastructure.vector_store.pgvector import PgVectorStoreAdapter
+        vector_store = PgVectorStoreAdapter(
+            embedding=embedding,
+            table_name=vs_config.get("collection_name", "corporate_disclosures"),
+            docs_directory=_DOCS_DIR,
         )
-    return _hybrid_retriever
+    else:
+        from src.infrastructure.vector_store.chroma import ChromaVectorStoreAdapter
+        vector_store = ChromaVectorStoreAdapter(
+            embedding=embedding,
+            persist_directory=vs_config.get("persist_directory", _CHROMA_DIR),
+            collection_name=vs_config.get("collection_name", "corporate_disclosures"),
+            docs_directory=_DOCS_DIR,
+        )
+    return HybridRetriever(
+        vector_store=vector_store,
+        vector_weight=ret_config.get("vector_weight", 0.6),
+        bm25_weight=ret_config.get("bm25_weight", 0.4),
+        rrf_k=ret_config.get("rrf_k", 60),
+        embedding=embedding,
+        semantic_cache=SemanticQueryCache(
+            threshold=ret_config.get("semantic_cache_threshold", 0.98),
+        ),
+    )
 
 
 def reseed_rag_documents() -> int:
@@ -132,6 +167,7 @@ def reseed_rag_documents() -> int:
     if not _use_postgres():
         raise RuntimeError("reseed_rag_documents requires DATABASE_URL (pgvector)")
     _hybrid_retriever = None
+    get_tool_cache().clear("search_corporate_disclosures")
     vs_config = get_vector_store_config()
     embedding = create_embeddings()
     from src.infrastructure.vector_store.pgvector import PgVectorStoreAdapter
@@ -151,6 +187,11 @@ class GetMarketDataInput(BaseModel):
     include_financials: bool = Field(default=True, description="Include balance-sheet ratios.")
 
 
+class GetMarketDataBatchInput(BaseModel):
+    tickers: list[str] = Field(..., description="Ticker symbols to compare (e.g. ['AAPL', 'MSFT', 'TSM']).")
+    period: str = Field(default="1mo", description="Historical price period.")
+
+
 class SearchGeopoliticalNewsInput(BaseModel):
     query: str = Field(..., description="Search query for geopolitical news.")
     region: str = Field(default="wt-wt", description="DuckDuckGo region code.")
@@ -168,6 +209,12 @@ class SearchCorporateDisclosuresInput(BaseModel):
     company_filter: str | None = Field(default=None, description="Optional company name filter.")
 
 
+class SearchCorporateDisclosuresBatchInput(BaseModel):
+    queries: list[str] = Field(..., description="Related search queries for corporate disclosures (max 8).")
+    num_results: int = Field(default=5, description="Number of results per query (1-10).")
+    company_filter: str | None = Field(default=None, description="Optional company name filter.")
+
+
 class RetrievedDocumentOutput(BaseModel):
     content: str = Field(default="")
     source: str = Field(default="unknown")
@@ -186,24 +233,90 @@ class SearchCorporateDisclosuresOutput(BaseModel):
     error: str | None = Field(default=None)
 
 
+class SearchCorporateDisclosuresBatchOutput(BaseModel):
+    searches: list[SearchCorporateDisclosuresOutput] = Field(default_factory=list)
+    error: str | None = Field(default=None)
+
+
 # ── LangChain @tool wrappers (delegate to adapters) ────────────────
 
 @tool(args_schema=GetMarketDataInput)
 def get_market_data(ticker: str, period: str = "1mo", include_financials: bool = True) -> str:
     """Fetch real-time market data, price history, and key financial ratios for a given stock ticker."""
-    return get_market_adapter().get_market_data(ticker, period, include_financials)
+    return get_tool_cache().get_or_call(
+        "get_market_data", _MARKET_DATA_TTL, get_market_adapter().get_market_data,
+        ticker=ticker.upper(), period=period, include_financials=include_financials,
+    )
+
+
+@tool(args_schema=GetMarketDataBatchInput)
+def get_market_data_batch(tickers: list[str], period: str = "1mo") -> str:
+    """Fetch recent prices and period performance for several tickers at once (peer comparison)."""
+    return get_tool_cache().get_or_call(
+        "get_market_data_batch", _MARKET_DATA_TTL, get_market_adapter().get_market_data_batch,
+        tickers=sorted({t.strip().upper() for t in tickers}), period=period,
+    )
 
 
 @tool(args_schema=SearchGeopoliticalNewsInput)
 def search_geopolitical_news(query: str, region: str = "wt-wt", max_results: int = 8) -> str:
     """Search for recent geopolitical and macro-economic news articles."""
-    return get_news_adapter().search_news(query, region, max_results)
+    return get_tool_cache().get_or_call(
+        "search_geopolitical_news", _NEWS_TTL, get_news_adapter().search_news,
+        query=query, region=region, max_results=max_results,
+    )
 
 
 @tool(args_schema=SearchWebGeneralInput)
 def search_web_general(query: str, max_results: int = 5) -> str:
     """Perform a general web search for background research and context."""
-    return get_news_adapter().search_web(query, max_results)
+    return get_tool_cache().get_or_call(
+        "search_web_general", _NEWS_TTL, get_news_adapter().search_web,
+        query=query, max_results=max_results,
+    )
+
+
+def _search_disclosures_cached(query: str, num_results: int, company_filter: str | None) -> str:
+    """Read-only RAG lookup, memoised on disk for _DISCLOSURES_TTL (cleared on reseed).
+
+    Raises on failure so errors are never cached.
+    """
+    return get_tool_cache().get_or_call(
+        "search_corporate_disclosures", _DISCLOSURES_TTL, _search_disclosures,
+        query=query, num_results=num_results, company_filter=company_filter,
+    )
+
+
+@lru_cache(maxsize=64)
+def _company_filter_dict(company_filter: str | None) -> dict | None:
+    """Vector store filter for a company (shared instance — treat as read-only)."""
+    if not company_filter:
+        return None
+    # company_scope is set at ingest: the company itself, or "broad_macro"
+    # for reports that apply to every entity
+    return {
+        "$or": [
+            {"company_scope": company_scope(company_filter)},
+            {"company_scope": BROAD_MACRO_SCOPE},
+        ]
+    }
+
+
+def _disclosures_output(query: str, documents: list[dict]) -> SearchCorporateDisclosuresOutput:
+    return SearchCorporateDisclosuresOutput(
+        query=query,
+        num_results=len(documents),
+        documents=[RetrievedDocumentOutput(**d) for d in documents],
+    )
+
+
+def _search_disclosures(query: str, num_results: int, company_filter: str | None) -> str:
+    documents = get_hybrid_retriever().search(
+        query=query,
+        num_results=num_results,
+        filter_dict=_company_filter_dict(company_filter),
+    )
+    return _disclosures_output(query, documents).model_dump_json(indent=2)
 
 
 @tool(args_schema=SearchCorporateDisclosuresInput)
@@ -215,40 +328,47 @@ def search_corporate_disclosures(query: str, num_results: int = 5, company_filte
     risk reports (WEF, Fitch, Apollo Outlooks).
     """
     try:
-        filter_dict = None
-        if company_filter:
-            filter_dict = {
-                "$or": [
-                    {"company": company_filter},
-                    {"company": "Global"},
-                    {"company": "General Risk"},
-                    {"company": "Industry Report"},
-                    {"company": "General"},
-                ]
-            }
-
-        documents = get_hybrid_retriever().search(
-            query=query,
-            num_results=min(num_results, 10),
-            filter_dict=filter_dict,
-        )
-
-        output = SearchCorporateDisclosuresOutput(
-            query=query,
-            num_results=len(documents),
-            documents=[RetrievedDocumentOutput(**d) for d in documents],
-        )
-        return output.model_dump_json(indent=2)
-
+        return _search_disclosures_cached(query, min(num_results, 10), company_filter)
     except Exception as e:
         return SearchCorporateDisclosuresOutput(
             query=query, error=f"RAG search failed: {str(e)}"
         ).model_dump_json()
 
 
+@tool(args_schema=SearchCorporateDisclosuresBatchInput)
+def search_corporate_disclosures_batch(
+    queries: list[str], num_results: int = 5, company_filter: str | None = None
+) -> str:
+    """Run several related searches over the risk disclosure database in one call.
+
+    Same hybrid retrieval as search_corporate_disclosures; the queries are
+    searched in parallel.
+    """
+    unique_queries = list(dict.fromkeys(q.strip() for q in queries if q.strip()))[:8]
+    try:
+        results = get_hybrid_retriever().search_many(
+            unique_queries,
+            num_results=min(num_results, 10),
+            filter_dict=_company_filter_dict(company_filter),
+        )
+    except Exception as e:
+        return SearchCorporateDisclosuresBatchOutput(
+            error=f"RAG search failed: {str(e)}"
+        ).model_dump_json()
+    return SearchCorporateDisclosuresBatchOutput(
+        searches=[_disclosures_output(q, docs) for q, docs in zip(unique_queries, results)],
+    ).model_dump_json(indent=2)
+
+
 # ── Tool sets per agent ─────────────────────────────────────────────
-GEOPOLITICAL_TOOLS = [search_geopolitical_news, search_web_general, search_corporate_disclosures]
-CREDIT_TOOLS = [get_market_data, search_corporate_disclosures, search_web_general]
+GEOPOLITICAL_TOOLS = [
+    search_geopolitical_news, search_web_general,
+    search_corporate_disclosures, search_corporate_disclosures_batch,
+]
+CREDIT_TOOLS = [
+    get_market_data, get_market_data_batch,
+    search_corporate_disclosures, search_corporate_disclosures_batch, search_web_general,
+]
 SYNTHESIZER_TOOLS = [search_corporate_disclosures, search_web_general]
 
 # Tool registry for dispatch
@@ -256,7 +376,9 @@ TOOL_REGISTRY = {
     "search_geopolitical_news": search_geopolitical_news,
     "search_web_general": search_web_general,
     "search_corporate_disclosures": search_corporate_disclosures,
+    "search_corporate_disclosures_batch": search_corporate_disclosures_batch,
     "get_market_data": get_market_data,
+    "get_market_data_batch": get_market_data_batch,
 }
 
 
@@ -49,9 +49,65 @@ class RiskReport(BaseModel):
         }
 
 
+# ── Pre-compiled patterns (built once at import) ─────────────────────
+
+_MARKDOWN_EMPHASIS_RE = re.compile(r"\*{1,2}([^*]+)\*{1,2}")
+# Header fields, scanned in a single pass. Each alternative is a zero-width
+# lookahead so a match never consumes text another field might start in,
+# which keeps "first occurrence per field" identical to independent searches.
+_HEADER_FIELDS: tuple[tuple[str, str], ...] = (
+    ("entity", r"ENTITY:\s*(?P<entity>.+)"),
+    ("date", r"DATE:\s*(?P<date>\d{4}-\d{2}-\d{2})"),
+    # "OVERALL RISK SCORE: 42/100" or "Overall Risk Score: 42 / 100"
+    ("overall", r"OVERALL\s+RISK\s+SCORE\s*[:=\-—]\s*(?P<overall>\d+)\s*/\s*100"),
+    # Sub-scores: flexible patterns to handle LLM variations
+    # e.g. "Geopolitical Risk: 35/100", "- Geopolitical Risk — 35/100", "Geopolitical: 35 / 100"
+    ("geo", r"Geopolitical(?:\s+Risk)?\s*[:=\-—]+\s*(?P<geo>\d+)\s*/\s*100"),
+    ("credit", r"Credit(?:[/\s]*Financial)?\s*(?:Risk)?\s*[:=\-—]+\s*(?P<credit>\d+)\s*/\s*100"),
+    ("market", r"Market(?:[/\s]*Liquidity)?\s*(?:Risk)?\s*[:=\-—]+\s*(?P<market>\d+)\s*/\s*100"),
+    ("esg", r"ESG(?:[/\s]*Transition)?\s*(?:Risk)?\s*[:=\-—]+\s*(?P<esg>\d+)\s*/\s*100"),
+    # "INTERNAL CREDIT RATING: BBB+ / Stable" or "Credit Rating: BBB+"
+    ("rating", r"(?:INTERNAL\s+)?CREDIT\s+RATING\s*[:=\-—]+\s*(?P<rating>.+)"),
+)
+_HEADER_RE = re.compile("|".join(f"(?={pattern})" for _, pattern in _HEADER_FIELDS), re.IGNORECASE)
+# Literal substrings (upper-cased) at least one of which every header field requires
+_HEADER_ANCHORS = ("ENTITY:", "DATE:", "100", "RATING")
+_FACTORS_RE = re.compile(r"KEY RISK FACTORS.*?\n((?:[\s]*\d+\..+\n?)+)", re.DOTALL | re.IGNORECASE)
+_RECOMMENDATIONS_RE = re.compile(r"RECOMMENDATIONS.*?\n((?:[\s]*\d+\..+\n?)+)", re.DOTALL | re.IGNORECASE)
+_SCENARIO_RES = tuple(
+    (label, re.compile(rf"{label}\s+CASE\s*\((\d+)%\s*probability\)\s*[:=\-—]*\s*(.+?)(?:\n|$)", re.IGNORECASE))
+    for label in ("BULL", "BASE", "BEAR")
+)
+_LIST_PREFIX_RE = re.compile(r"^\s*\d+\.\s*")
+
+
 def _strip_markdown(text: str) -> str:
     """Remove markdown bold/italic markers for cleaner regex matching."""
-    return re.sub(r"\*{1,2}([^*]+)\*{1,2}", r"\1", text)
+    return _MARKDOWN_EMPHASIS_RE.sub(r"\1", text)
+
+
+def _scan_header_fields(text: str) -> dict[str, str]:
+    """Return the first match of every header field in one linear scan."""
+    found: dict[str, str] = {}
+    for m in _HEADER_RE.finditer(text):
+        key = m.lastgroup
+        if key not in found:
+            found[key] = m.group(key).strip()
+            if len(found) == len(_HEADER_FIELDS):
+                break
+    return found
+
+
+def _extract_numbered_list(pattern: re.Pattern[str], text: str) -> list[str]:
+    m = pattern.search(text)
+    if not m:
+        return []
+    items: list[str] = []
+    for line in m.group(1).strip().split("\n"):
+        cleaned = _LIST_PREFIX_RE.sub("", line).strip()
+        if cleaned:
+            items.append(cleaned)
+    return items
 
 
 def parse_report_to_structured(report_text: str) -> RiskReport:
@@ -62,67 +118,38 @@ def parse_report_to_structured(report_text: str) -> RiskReport:
     """
     # Strip markdown formatting for reliable matching
     clean = _strip_markdown(report_text)
+    # Cheap substring checks let legacy / malformed reports skip the regexes
+    upper = clean.upper()
 
-    def _extract_int(pattern: str, text: str, default: int = 0) -> int:
-        m = re.search(pattern, text, re.IGNORECASE)
-        return int(m.group(1)) if m else default
-
-    def _extract_str(pattern: str, text: str, default: str = "") -> str:
-        m = re.search(pattern, text, re.IGNORECASE)
-        return m.group(1).strip() if m else default
+    fields = _scan_header_fields(clean) if any(a in upper for a in _HEADER_ANCHORS) else {}
+    entity = fields.get("entity", "Unknown")
+    date = fields.get("date", "")
 
-    entity = _extract_str(r"ENTITY:\s*(.+)", clean, "Unknown")
-    date = _extract_str(r"DATE:\s*(\d{4}-\d{2}-\d{2})", clean)
+    overall = int(fields.get("overall", 0))
+    geo = int(fields.get("geo", 0))
+    credit = int(fields.get("credit", 0))
+    market = int(fields.get("market", 0))
+    esg = int(fields.get("esg", 0))
 
-    # Overall score: "OVERALL RISK SCORE: 42/100" or "Overall Risk Score: 42 / 100"
-    overall = _extract_int(r"OVERALL\s+RISK\s+SCORE\s*[:=\-—]\s*(\d+)\s*/\s*100", clean)
-
-    # Sub-scores: flexible patterns to handle LLM variations
-    # e.g. "Geopolitical Risk: 35/100", "- Geopolitical Risk — 35/100", "Geopolitical: 35 / 100"
-    geo = _extract_int(r"Geopolitical(?:\s+Risk)?\s*[:=\-—]+\s*(\d+)\s*/\s*100", clean)
-    credit = _extract_int(r"Credit(?:[/\s]*Financial)?\s*(?:Risk)?\s*[:=\-—]+\s*(\d+)\s*/\s*100", clean)
-    market = _extract_int(r"Market(?:[/\s]*Liquidity)?\s*(?:Risk)?\s*[:=\-—]+\s*(\d+)\s*/\s*100", clean)
-    esg = _extract_int(r"ESG(?:[/\s]*Transition)?\s*(?:Risk)?\s*[:=\-—]+\s*(\d+)\s*/\s*100", clean)
-
-    # Credit rating: "INTERNAL CREDIT RATING: BBB+ / Stable" or "Credit Rating: BBB+"
-    rating_str = _extract_str(
-        r"(?:INTERNAL\s+)?CREDIT\s+RATING\s*[:=\-—]+\s*(.+)", clean, "N/A"
-    )
+    rating_str = fields.get("rating", "N/A")
     parts = [p.strip() for p in rating_str.split("/")]
     credit_rating = parts[0] if parts else "N/A"
     credit_outlook = parts[1] if len(parts) > 1 else "Stable"
 
-    risk_factors: list[str] = []
-    factors_match = re.search(
-        r"KEY RISK FACTORS.*?\n((?:[\s]*\d+\..+\n?)+)", clean, re.DOTALL | re.IGNORECASE
-    )
-    if factors_match:
-        for line in factors_match.group(1).strip().split("\n"):
-            cleaned = re.sub(r"^\s*\d+\.\s*", "", line).strip()
-            if cleaned:
-                risk_factors.append(cleaned)
+    risk_factors = _extract_numbered_list(_FACTORS_RE, clean) if "KEY RISK FACTORS" in upper else []
 
     scenarios: list[Scenario] = []
-    for label in ["BULL", "BASE", "BEAR"]:
-        m = re.search(
-            rf"{label}\s+CASE\s*\((\d+)%\s*probability\)\s*[:=\-—]*\s*(.+?)(?:\n|$)",
-            clean,
-            re.IGNORECASE,
-        )
-        if m:
-            scenarios.append(
-                Scenario(label=label, probability_pct=int(m.group(1)), description=m.group(2).strip())
-            )
-
-    recommendations: list[str] = []
-    rec_match = re.search(
-        r"RECOMMENDATIONS.*?\n((?:[\s]*\d+\..+\n?)+)", clean, re.DOTALL | re.IGNORECASE
+    if "CASE" in upper:
+        for label, pattern in _SCENARIO_RES:
+            m = pattern.search(clean)
+            if m:
+                scenarios.append(
+                    Scenario(label=label, probability_pct=int(m.group(1)), description=m.group(2).strip())
+                )
+
+    recommendations = (
+        _extract_numbered_list(_RECOMMENDATIONS_RE, clean) if "RECOMMENDATIONS" in upper else []
     )
-    if rec_match:
-        for line in rec_match.group(1).strip().split("\n"):
-            cleaned = re.sub(r"^\s*\d+\.\s*", "", line).strip()
-            if cleaned:
-                recommendations.append(cleaned)
 
     return RiskReport(
         entity=entity,
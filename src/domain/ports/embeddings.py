@@ -9,7 +9,8 @@ from typing import Protocol, runtime_checkable
 class EmbeddingPort(Protocol):
     """Abstract interface for embedding providers.
 
-    Implementations: OllamaEmbeddingAdapter, HuggingFaceEmbeddingAdapter.
+    Implementations: OllamaEmbeddingAdapter, FastEmbedEmbeddingAdapter,
+    HuggingFaceEmbeddingAdapter (optionally wrapped by CachedEmbeddingAdapter).
     """
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, AsyncIterator, Protocol, runtime_checkable
 
 
 @runtime_checkable
@@ -16,6 +16,10 @@ class LLMPort(Protocol):
         """Invoke the LLM asynchronously."""
         ...
 
+    def astream(self, messages: list[Any]) -> AsyncIterator[Any]:
+        """Stream response chunks; closing the iterator early stops generation."""
+        ...
+
     def bind_tools(self, tools: list[Any]) -> LLMPort:
         """Return a new LLM instance with tools bound."""
         ...
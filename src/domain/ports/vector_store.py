@@ -15,6 +15,11 @@ class VectorStorePort(Protocol):
     def similarity_search(self, query: str, k: int = 5, filter: dict | None = None) -> list[Any]:
         ...
 
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 5, filter: dict | None = None
+    ) -> list[Any]:
+        ...
+
     def add_documents(self, documents: list[Any]) -> None:
         ...
 
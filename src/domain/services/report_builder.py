@@ -6,7 +6,19 @@ Pure logic for extracting and transforming LLM output.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterator
+
+
+def _iter_text_blocks(content: list) -> Iterator[str]:
+    """Yield the non-blank text blocks of a structured content list."""
+    for block in content:
+        if isinstance(block, dict):
+            if block.get("type") == "text":
+                text = block.get("text", "")
+                if text.strip():
+                    yield text
+        elif isinstance(block, str) and block.strip():
+            yield block
 
 
 def extract_text(content: Any) -> str:
@@ -14,17 +26,9 @@ def extract_text(content: Any) -> str:
     if isinstance(content, str):
         return content
     if isinstance(content, list):
-        parts = []
-        for block in content:
-            if isinstance(block, dict):
-                if block.get("type") == "text":
-                    text = block.get("text", "")
-                    if text.strip():
-                        parts.append(text)
-            elif isinstance(block, str):
-                if block.strip():
-                    parts.append(block)
-        return "\n".join(parts)
+        if len(content) == 1 and isinstance(content[0], str):
+            return content[0] if content[0].strip() else ""
+        return "\n".join(_iter_text_blocks(content))
     return str(content)
 
 
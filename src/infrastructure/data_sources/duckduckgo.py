@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import os
+import threading
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
@@ -42,6 +44,23 @@ class WebSearchOutput(BaseModel):
     error: Optional[str] = None
 
 
+# One DDGS per worker thread: it caches its engine instances (and their HTTP
+# clients/cookies) across calls, but is not meant to be shared between threads.
+_ddgs_local = threading.local()
+
+# Concurrent searches across all agents (tools run in worker threads)
+_DDG_SLOTS = threading.BoundedSemaphore(int(os.getenv("DDG_MAX_CONCURRENCY", "4")))
+
+
+def _get_ddgs() -> Any:
+    ddgs = getattr(_ddgs_local, "client", None)
+    if ddgs is None:
+        from ddgs import DDGS
+
+        ddgs = _ddgs_local.client = DDGS()
+    return ddgs
+
+
 class DuckDuckGoAdapter:
     """NewsPort implementation backed by DuckDuckGo Search (ddgs)."""
 
@@ -56,10 +75,8 @@ class DuckDuckGoAdapter:
 
     def search_news(self, query: str, region: str = "wt-wt", max_results: int = 8) -> str:
         try:
-            from ddgs import DDGS
-
-            with DDGS() as ddgs:
-                results = list(ddgs.news(query, region=region, max_results=min(max_results, 15)))
+            with _DDG_SLOTS:
+                results = list(_get_ddgs().news(query, region=region, max_results=min(max_results, 15)))
 
             articles: list[dict] = []
             for r in results:
@@ -93,10 +110,8 @@ class DuckDuckGoAdapter:
 
     def search_web(self, query: str, max_results: int = 5) -> str:
         try:
-            from ddgs import DDGS
-
-            with DDGS() as ddgs:
-                results = list(ddgs.text(query, max_results=min(max_results, 10)))
+            with _DDG_SLOTS:
+                results = list(_get_ddgs().text(query, max_results=min(max_results, 10)))
 
             items: list[dict] = []
             for r in results:
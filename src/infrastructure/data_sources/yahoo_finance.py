@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import yfinance as yf
+import os
+import threading
+
 from pydantic import BaseModel, Field
 from typing import Optional
 
@@ -15,6 +17,59 @@ class MarketDataOutput(BaseModel):
     error: Optional[str] = None
 
 
+class PeerPricesOutput(BaseModel):
+    recent_prices: list[dict] = Field(default_factory=list)
+    price_change_pct: float = 0.0
+    error: Optional[str] = None
+
+
+class MarketDataBatchOutput(BaseModel):
+    period: str = ""
+    tickers: dict[str, PeerPricesOutput] = Field(default_factory=dict)
+    error: Optional[str] = None
+
+
+# Concurrent Yahoo requests across all agents (tools run in worker threads)
+_YF_SLOTS = threading.BoundedSemaphore(int(os.getenv("YF_MAX_CONCURRENCY", "4")))
+
+
+def _fast(fast_info, key: str):
+    """Read one fast_info field; yfinance raises for fields it cannot derive."""
+    try:
+        return fast_info[key]
+    except Exception:
+        return None
+
+
+def _pick(info: dict, fast_info, fast_key: str, *info_keys: str):
+    """First non-null ``info`` field, else the ``fast_info`` one.
+
+    ``info`` is read first: each fast_info field can trigger its own request
+    (history, shares), so it is only touched for fields ``info`` lacks —
+    or for every price field when ``info`` was not fetched at all.
+    """
+    for key in info_keys:
+        value = info.get(key)
+        if value is not None:
+            return value
+    return _fast(fast_info, fast_key)
+
+
+def _recent_prices(hist, n: int = 5) -> list[dict]:
+    """Last ``n`` rows as records — column-wise conversion, no per-row Series.
+
+    Volume can be NaN (e.g. an index, or a partial row in a multi-ticker
+    download); it is reported as None rather than failing the call.
+    """
+    tail = hist.tail(n)
+    return [
+        {"date": date, "close": round(close, 2), "volume": int(volume) if volume == volume else None}
+        for date, close, volume in zip(
+            tail.index.strftime("%Y-%m-%d"), tail["Close"].tolist(), tail["Volume"].tolist()
+        )
+    ]
+
+
 class YahooFinanceAdapter:
     """MarketDataPort implementation backed by Yahoo Finance (yfinance)."""
 
@@ -24,26 +79,41 @@ class YahooFinanceAdapter:
         period: str = "1mo",
         include_financials: bool = True,
     ) -> str:
+        with _YF_SLOTS:
+            return self._get_market_data(ticker, period, include_financials)
+
+    def get_market_data_batch(self, tickers: list[str], period: str = "1mo") -> str:
+        """Price history for several tickers in one yf.download burst."""
+        with _YF_SLOTS:
+            return self._get_market_data_batch(tickers, period)
+
+    def _get_market_data(self, ticker: str, period: str, include_financials: bool) -> str:
+        # yfinance pulls in pandas (~0.3s); import on first tool call, not at startup
+        import yfinance as yf
+
         try:
             stock = yf.Ticker(ticker)
-            info = stock.info
+            # The full quoteSummary (.info) is only fetched when financials are
+            # wanted; otherwise price fields come from fast_info alone.
+            fi = stock.fast_info
+            info: dict = stock.get_info() if include_financials else {}
 
             snapshot: dict = {
                 "ticker": ticker.upper(),
                 "name": info.get("longName", info.get("shortName", ticker)),
                 "sector": info.get("sector", "N/A"),
                 "industry": info.get("industry", "N/A"),
-                "currency": info.get("currency", "USD"),
-                "current_price": info.get("currentPrice") or info.get("regularMarketPrice"),
-                "previous_close": info.get("previousClose"),
-                "market_cap": info.get("marketCap"),
+                "currency": _pick(info, fi, "currency", "currency") or "USD",
+                "current_price": _pick(info, fi, "lastPrice", "currentPrice", "regularMarketPrice"),
+                "previous_close": _pick(info, fi, "previousClose", "previousClose"),
+                "market_cap": _pick(info, fi, "marketCap", "marketCap"),
                 "pe_ratio_trailing": info.get("trailingPE"),
                 "pe_ratio_forward": info.get("forwardPE"),
                 "dividend_yield": info.get("dividendYield"),
-                "52_week_high": info.get("fiftyTwoWeekHigh"),
-                "52_week_low": info.get("fiftyTwoWeekLow"),
-                "50_day_average": info.get("fiftyDayAverage"),
-                "200_day_average": info.get("twoHundredDayAverage"),
+                "52_week_high": _pick(info, fi, "yearHigh", "fiftyTwoWeekHigh"),
+                "52_week_low": _pick(info, fi, "yearLow", "fiftyTwoWeekLow"),
+                "50_day_average": _pick(info, fi, "fiftyDayAverage", "fiftyDayAverage"),
+                "200_day_average": _pick(info, fi, "twoHundredDayAverage", "twoHundredDayAverage"),
                 "beta": info.get("beta"),
             }
 
@@ -77,12 +147,7 @@ class YahooFinanceAdapter:
             price_change_pct = 0.0
             hist = stock.history(period=period)
             if not hist.empty:
-                for date, row in hist.tail(5).iterrows():
-                    price_history.append({
-                        "date": date.strftime("%Y-%m-%d"),
-                        "close": round(row["Close"], 2),
-                        "volume": int(row["Volume"]),
-                    })
+                price_history = _recent_prices(hist)
                 snapshot["recent_prices"] = price_history
                 if hist["Close"].iloc[0] != 0:
                     price_change_pct = round(
@@ -101,3 +166,38 @@ class YahooFinanceAdapter:
         except Exception as e:
             output = MarketDataOutput(error=f"Failed to fetch data for {ticker.upper()}: {str(e)}")
             return output.model_dump_json()
+
+    def _get_market_data_batch(self, tickers: list[str], period: str) -> str:
+        symbols = list(dict.fromkeys(t.strip().upper() for t in tickers if t.strip()))
+        if not symbols:
+            return MarketDataBatchOutput(period=period, error="No tickers given.").model_dump_json()
+        import yfinance as yf
+
+        try:
+            frame = yf.download(
+                " ".join(symbols), period=period, group_by="ticker",
+                threads=True, progress=False, auto_adjust=False,
+            )
+
+            results: dict[str, PeerPricesOutput] = {}
+            for symbol in symbols:
+                try:
+                    hist = frame[symbol].dropna(subset=["Close"])
+                except KeyError:
+                    results[symbol] = PeerPricesOutput(error="No data returned.")
+                    continue
+                if hist.empty:
+                    results[symbol] = PeerPricesOutput(error="No data returned.")
+                    continue
+
+                recent = _recent_prices(hist)
+                first, last = hist["Close"].iloc[0], hist["Close"].iloc[-1]
+                change = round(((last - first) / first) * 100, 2) if first != 0 else 0.0
+                results[symbol] = PeerPricesOutput(recent_prices=recent, price_change_pct=change)
+
+            return MarketDataBatchOutput(period=period, tickers=results).model_dump_json()
+
+        except Exception as e:
+            return MarketDataBatchOutput(
+                period=period, error=f"Failed to fetch data for {', '.join(symbols)}: {str(e)}"
+            ).model_dump_json()
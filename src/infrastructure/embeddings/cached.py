@@ -0,0 +1,86 @@
+"""Infrastructure — Persistent embedding cache (content-hash keyed)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from src.domain.ports.embeddings import EmbeddingPort
+
+
+class CachedEmbeddingAdapter:
+    """EmbeddingPort decorator that memoises vectors on disk.
+
+    Vectors are stored as raw float32 blobs in SQLite, keyed by a BLAKE2b
+    digest of the model identity and the text, so re-ingesting unchanged
+    chunks and repeating a query skip the model entirely. Recent queries are
+    additionally kept in an in-process LRU.
+    """
+
+    def __init__(self, inner: EmbeddingPort, path: str, model_id: str):
+        self._inner = inner
+        self._model_id = model_id.encode("utf-8")
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._query_lru = lru_cache(maxsize=1024)(self._embed_query_uncached)
+
+    def _key(self, text: str) -> str:
+        return hashlib.blake2b(self._model_id + b"\0" + text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _lookup(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def _store(self, items: list[tuple[str, list[float]]]) -> None:
+        rows = [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in items]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows)
+            self._conn.commit()
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys = [self._key(text) for text in texts]
+        found = self._lookup(list(set(keys)))
+
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        if missing:
+            vectors = self._inner.embed_documents(list(missing.values()))
+            computed = list(zip(missing.keys(), vectors))
+            self._store(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def _embed_query_uncached(self, text: str) -> tuple[float, ...]:
+        key = self._key("query:" + text)
+        found = self._lookup([key])
+        if key in found:
+            return tuple(found[key])
+        vector = self._inner.embed_query(text)
+        self._store([(key, vector)])
+        return tuple(vector)
+
+    def embed_query(self, text: str) -> list[float]:
+        return list(self._query_lru(text))
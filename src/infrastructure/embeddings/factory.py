@@ -5,21 +5,51 @@ Creates the appropriate embedding adapter based on configuration.
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
+
 from src.domain.ports.embeddings import EmbeddingPort
 from src.infrastructure.config.providers import get_embedding_config
 
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
 
 def create_embeddings(provider: str | None = None) -> EmbeddingPort:
     """Factory: create the right embedding adapter.
 
     Args:
-        provider: "ollama" or "huggingface". If None, reads from config.
+        provider: "ollama", "fastembed" or "huggingface". If None, reads from config.
 
     Returns:
-        An object satisfying EmbeddingPort.
+        An object satisfying EmbeddingPort. Adapters are cached per provider,
+        so ingestion, retrieval and reseeds share one loaded model, and are
+        wrapped in a persistent vector cache unless ``cache_path`` is empty.
     """
+    provider = provider or get_embedding_config().get("default", "ollama")
+    return _cached_embeddings(provider)
+
+
+@lru_cache(maxsize=4)
+def _cached_embeddings(provider: str) -> EmbeddingPort:
     config = get_embedding_config()
-    provider = provider or config.get("default", "ollama")
+    adapter = _create_adapter(provider, config)
+
+    cache_path = config.get("cache_path", "data/cache/embeddings.db")
+    if not cache_path:
+        return adapter
+
+    from src.infrastructure.embeddings.cached import CachedEmbeddingAdapter
+
+    provider_config = config.get("providers", {}).get(provider, {})
+    model_id = f"{provider}:{provider_config.get('model', '')}"
+    return CachedEmbeddingAdapter(
+        adapter,
+        path=os.path.join(_PROJECT_ROOT, cache_path),
+        model_id=model_id,
+    )
+
+
+def _create_adapter(provider: str, config: dict) -> EmbeddingPort:
 
     if provider == "huggingface":
         from src.infrastructure.embeddings.huggingface import HuggingFaceEmbeddingAdapter
@@ -28,6 +58,17 @@ def create_embeddings(provider: str | None = None) -> EmbeddingPort:
         return HuggingFaceEmbeddingAdapter(
             model_name=hf_config.get("model", "all-MiniLM-L6-v2"),
             device=hf_config.get("device", "cpu"),
+            threads=_resolve_threads(hf_config.get("threads")),
+        )
+
+    if provider == "fastembed":
+        from src.infrastructure.embeddings.fastembed import FastEmbedEmbeddingAdapter
+
+        fe_config = config.get("providers", {}).get("fastembed", {})
+        return FastEmbedEmbeddingAdapter(
+            model_name=fe_config.get("model", "BAAI/bge-small-en-v1.5"),
+            batch_size=fe_config.get("batch_size", 64),
+            threads=_resolve_threads(fe_config.get("threads")),
         )
 
     # Default: Ollama embeddinggemma
@@ -38,3 +79,10 @@ def create_embeddings(provider: str | None = None) -> EmbeddingPort:
         model=ollama_config.get("model", "embeddinggemma"),
         base_url=ollama_config.get("base_url"),
     )
+
+
+def _resolve_threads(value: int | str | None) -> int | None:
+    """Thread count for local CPU encoders: an int, "auto" (all logical CPUs), or unset (library default)."""
+    if value == "auto":
+        return os.cpu_count()
+    return int(value) if value else None
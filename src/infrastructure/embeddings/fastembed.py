@@ -0,0 +1,37 @@
+"""Infrastructure — FastEmbed embedding adapter (quantized ONNX, CPU)."""
+
+from __future__ import annotations
+
+try:
+    from langchain_community.embeddings.fastembed import FastEmbedEmbeddings
+except ImportError:
+    FastEmbedEmbeddings = None  # type: ignore[assignment,misc]
+
+
+class FastEmbedEmbeddingAdapter:
+    """EmbeddingPort implementation backed by FastEmbed.
+
+    Runs quantized ONNX models through ONNX Runtime — no torch required, and
+    several times faster than the FP32 sentence-transformers path on CPU.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "BAAI/bge-small-en-v1.5",
+        batch_size: int = 64,
+        threads: int | None = None,
+    ):
+        if not FastEmbedEmbeddings:
+            raise ImportError(
+                "fastembed is not installed. "
+                "Install with: pip install fastembed"
+            )
+        self._embeddings = FastEmbedEmbeddings(
+            model_name=model_name, batch_size=batch_size, threads=threads or None,
+        )
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self._embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embeddings.embed_query(text)
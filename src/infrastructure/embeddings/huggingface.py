@@ -5,6 +5,8 @@ Kept as a fallback option if Ollama embedding is not available.
 
 from __future__ import annotations
 
+import os
+
 from langchain_huggingface import HuggingFaceEmbeddings
 
 
@@ -18,12 +20,27 @@ class HuggingFaceEmbeddingAdapter:
         self,
         model_name: str = "all-MiniLM-L6-v2",
         device: str = "cpu",
+        threads: int | None = None,
     ):
+        if threads:
+            import torch
+
+            # Opt-in and process-wide; tokenizer parallelism keeps its own default
+            torch.set_num_threads(threads)
         self._embeddings = HuggingFaceEmbeddings(
             model_name=model_name,
             model_kwargs={"device": device},
-            encode_kwargs={"normalize_embeddings": True},
+            encode_kwargs={"normalize_embeddings": True, "batch_size": 64},
         )
+        if os.getenv("EMBED_COMPILE", "").lower() in ("1", "true", "yes"):
+            self._compile_encoder()
+
+    def _compile_encoder(self) -> None:
+        """Fuse the transformer's ops with torch.compile (opt-in: JIT cost on first batch)."""
+        import torch
+
+        transformer = self._embeddings._client[0]
+        transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         return self._embeddings.embed_documents(texts)
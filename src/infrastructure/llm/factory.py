@@ -6,11 +6,10 @@ Creates the appropriate LLM adapter based on model name.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any
 
 from src.domain.ports.llm import LLMPort
-from src.infrastructure.llm.ollama import OllamaLLMAdapter
-from src.infrastructure.llm.google_genai import GeminiLLMAdapter
 
 
 def create_llm(
@@ -20,17 +19,29 @@ def create_llm(
 ) -> Any:
     """Factory: create the right LLM adapter based on model name.
 
-    Returns an object satisfying LLMPort (ainvoke + bind_tools).
+    Returns an object satisfying LLMPort (ainvoke + bind_tools). Adapters are
+    cached per (model, temperature, num_predict) so agent turns reuse the same
+    client and its HTTP connection pool.
     """
     model = model or os.getenv("OLLAMA_MODEL", "qwen3.5")
+    return _cached_llm(model, temperature, num_predict)
 
+
+@lru_cache(maxsize=16)
+def _cached_llm(model: str, temperature: float | None, num_predict: int | None) -> Any:
+    # Provider SDKs are imported on first use: the Gemini stack (grpc, protobuf)
+    # is never loaded for Ollama-only runs, and vice versa.
     if model.startswith("gemini"):
+        from src.infrastructure.llm.google_genai import GeminiLLMAdapter
+
         return GeminiLLMAdapter(
             model=model,
             temperature=temperature if temperature is not None else 0.1,
             max_output_tokens=num_predict if num_predict is not None else 8192,
         )
 
+    from src.infrastructure.llm.ollama import OllamaLLMAdapter
+
     return OllamaLLMAdapter(
         model=model,
         temperature=temperature,
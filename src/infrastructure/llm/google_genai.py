@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import Any, AsyncIterator
 
 try:
     from langchain_google_genai import ChatGoogleGenerativeAI
@@ -37,10 +37,20 @@ class GeminiLLMAdapter:
             max_output_tokens=max_output_tokens,
         )
 
+        self._bound: dict[tuple[str, ...], GeminiLLMAdapter] = {}
+
     async def ainvoke(self, messages: list[Any]) -> Any:
         return await self._llm.ainvoke(messages)
 
+    def astream(self, messages: list[Any]) -> AsyncIterator[Any]:
+        return self._llm.astream(messages)
+
     def bind_tools(self, tools: list[Any]) -> GeminiLLMAdapter:
-        adapter = GeminiLLMAdapter.__new__(GeminiLLMAdapter)
-        adapter._llm = self._llm.bind_tools(tools)
+        key = tuple(getattr(t, "name", repr(t)) for t in tools)
+        adapter = self._bound.get(key)
+        if adapter is None:
+            adapter = GeminiLLMAdapter.__new__(GeminiLLMAdapter)
+            adapter._llm = self._llm.bind_tools(tools)
+            adapter._bound = {}
+            self._bound[key] = adapter
         return adapter
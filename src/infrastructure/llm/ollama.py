@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+from typing import Any, AsyncIterator
 
 from langchain_ollama import ChatOllama
 
@@ -31,11 +31,21 @@ class OllamaLLMAdapter:
             num_predict=num_predict if num_predict is not None else cfg.get("num_predict", 4096),
         )
 
+        self._bound: dict[tuple[str, ...], OllamaLLMAdapter] = {}
+
     async def ainvoke(self, messages: list[Any]) -> Any:
         return await self._llm.ainvoke(messages)
 
+    def astream(self, messages: list[Any]) -> AsyncIterator[Any]:
+        return self._llm.astream(messages)
+
     def bind_tools(self, tools: list[Any]) -> OllamaLLMAdapter:
-        """Return a wrapper with tools bound to the underlying LLM."""
-        adapter = OllamaLLMAdapter.__new__(OllamaLLMAdapter)
-        adapter._llm = self._llm.bind_tools(tools)
+        """Return a wrapper with tools bound to the underlying LLM (cached per tool set)."""
+        key = tuple(getattr(t, "name", repr(t)) for t in tools)
+        adapter = self._bound.get(key)
+        if adapter is None:
+            adapter = OllamaLLMAdapter.__new__(OllamaLLMAdapter)
+            adapter._llm = self._llm.bind_tools(tools)
+            adapter._bound = {}
+            self._bound[key] = adapter
         return adapter
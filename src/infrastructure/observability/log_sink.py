@@ -0,0 +1,29 @@
+"""Infrastructure — Process log sink (enqueued loguru stderr)."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from loguru import logger
+
+_configured = False
+
+
+def configure_logging() -> None:
+    """Write logs from a background thread so agents never block on stderr.
+
+    Call once from a process entry point (CLI ``main()``, API lifespan). Only
+    loguru's own default stderr sink is replaced; sinks installed by the host
+    process are left alone. Level comes from LOG_LEVEL (loguru's default,
+    DEBUG, when unset).
+    """
+    global _configured
+    if _configured:
+        return
+    try:
+        logger.remove(0)
+    except ValueError:
+        pass  # default sink already removed by the host
+    logger.add(sys.stderr, level=os.getenv("LOG_LEVEL", "DEBUG"), enqueue=True)
+    _configured = True
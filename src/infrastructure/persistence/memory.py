@@ -14,12 +14,21 @@ class FileMemoryAdapter:
 
     def __init__(self, memory_path: str):
         self._path = memory_path
+        self._cache: tuple[int, str] | None = None  # (mtime_ns, content)
 
     def load(self) -> str:
-        if not os.path.isfile(self._path):
+        """Return AGENTS.md content, re-reading the file only when its mtime changes."""
+        try:
+            mtime_ns = os.stat(self._path).st_mtime_ns
+        except FileNotFoundError:
+            self._cache = None
             return ""
+        if self._cache is not None and self._cache[0] == mtime_ns:
+            return self._cache[1]
         with open(self._path, "r", encoding="utf-8") as f:
-            return f.read()
+            content = f.read()
+        self._cache = (mtime_ns, content)
+        return content
 
     def update(self, entity: str, scores: dict, date: str | None = None) -> None:
         date = date or datetime.now().strftime("%Y-%m-%d")
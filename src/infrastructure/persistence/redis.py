@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+from typing import Any
+
+# Process-wide saver: one connection pool shared by every graph run
+_saver: Any = None
+_saver_cm: Any = None
+_saver_lock = asyncio.Lock()
 
 
 def get_redis_checkpointer():
@@ -16,3 +23,29 @@ def get_redis_checkpointer():
     from langgraph.checkpoint.redis import AsyncRedisSaver
 
     return AsyncRedisSaver.from_conn_string(redis_url)
+
+
+async def get_redis_saver() -> Any:
+    """Return the shared AsyncRedisSaver, connecting on first use.
+
+    The saver stays open for the lifetime of the process; call
+    close_redis_saver() on shutdown.
+    """
+    global _saver, _saver_cm
+    if _saver is not None:
+        return _saver
+    async with _saver_lock:
+        if _saver is None:
+            cm = get_redis_checkpointer()
+            _saver = await cm.__aenter__()
+            _saver_cm = cm
+    return _saver
+
+
+async def close_redis_saver() -> None:
+    """Close the shared saver's connection pool, if one was opened."""
+    global _saver, _saver_cm
+    async with _saver_lock:
+        if _saver_cm is not None:
+            cm, _saver, _saver_cm = _saver_cm, None, None
+            await cm.__aexit__(None, None, None)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import sqlite3
 from typing import Any
@@ -135,3 +136,48 @@ class SQLiteFeedbackRepository:
         total, helpful = cursor.fetchone()
         conn.close()
         return compute_feedback_score(total or 0, helpful or 0)
+
+
+# ── LangGraph checkpointer ──────────────────────────────────────────
+
+_CHECKPOINT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
+    "data",
+    "checkpoints.db",
+)
+
+# Process-wide saver over one aiosqlite connection
+_saver: Any = None
+_saver_cm: Any = None
+_saver_lock = asyncio.Lock()
+
+
+async def get_sqlite_saver() -> Any:
+    """Return the shared AsyncSqliteSaver (local default checkpointer).
+
+    Thread state lives in data/checkpoints.db (override with CHECKPOINT_DB),
+    so finished or interrupted runs survive restarts. Raises ImportError when
+    langgraph-checkpoint-sqlite is not installed.
+    """
+    global _saver, _saver_cm
+    if _saver is not None:
+        return _saver
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with _saver_lock:
+        if _saver is None:
+            db_path = os.getenv("CHECKPOINT_DB", _CHECKPOINT_DB_PATH)
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+            cm = AsyncSqliteSaver.from_conn_string(db_path)
+            _saver = await cm.__aenter__()
+            _saver_cm = cm
+    return _saver
+
+
+async def close_sqlite_saver() -> None:
+    """Close the shared SQLite checkpointer connection, if one was opened."""
+    global _saver, _saver_cm
+    async with _saver_lock:
+        if _saver_cm is not None:
+            cm, _saver, _saver_cm = _saver_cm, None, None
+            await cm.__aexit__(None, None, None)
@@ -0,0 +1,88 @@
+"""Infrastructure — On-disk cache for deterministic tool results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Callable
+
+from pydantic_core import from_json
+
+
+class DiskToolCache:
+    """Exact-match cache of tool outputs, one JSON file per (tool, arguments).
+
+    Keys are the SHA-256 of the sorted-JSON arguments; freshness is checked
+    against the file mtime, so expiry needs no bookkeeping. Expired files are
+    deleted when read, and files older than ``max_age`` are swept on init
+    (most keys — LLM-written search queries — are never asked again).
+    Results carrying an ``error`` field are never stored.
+    """
+
+    def __init__(self, directory: str, max_age: float | None = None):
+        self._dir = directory
+        if max_age is not None:
+            self.sweep(max_age)
+
+    def _path(self, namespace: str, kwargs: dict[str, Any]) -> str:
+        payload = json.dumps(kwargs, sort_keys=True, default=str)
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return os.path.join(self._dir, namespace, f"{key}.json")
+
+    def get_or_call(self, namespace: str, ttl: float, fn: Callable[..., str], **kwargs: Any) -> str:
+        """Return a fresh cached result for ``fn(**kwargs)`` or compute and store it."""
+        path = self._path(namespace, kwargs)
+        try:
+            if time.time() - os.stat(path).st_mtime < ttl:
+                with open(path, "r", encoding="utf-8") as f:
+                    return f.read()
+            os.unlink(path)
+        except OSError:
+            pass
+
+        result = fn(**kwargs)
+        if not _is_error(result):
+            try:
+                directory = os.path.dirname(path)
+                os.makedirs(directory, exist_ok=True)
+                # Unique temp file: threads and processes may write the same key at once
+                fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(result)
+                    os.replace(tmp, path)
+                except OSError:
+                    os.unlink(tmp)
+                    raise
+            except OSError:
+                pass
+        return result
+
+    def clear(self, namespace: str | None = None) -> None:
+        """Drop one namespace, or the whole cache."""
+        target = os.path.join(self._dir, namespace) if namespace else self._dir
+        shutil.rmtree(target, ignore_errors=True)
+
+    def sweep(self, max_age: float) -> None:
+        """Delete entries (and stray temp files) older than ``max_age`` seconds."""
+        cutoff = time.time() - max_age
+        for root, _dirs, files in os.walk(self._dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.stat(path).st_mtime < cutoff:
+                        os.unlink(path)
+                except OSError:
+                    pass
+
+
+def _is_error(result: str) -> bool:
+    try:
+        payload = from_json(result)
+    except (TypeError, ValueError):
+        return True
+    return not isinstance(payload, dict) or bool(payload.get("error"))
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import json
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from langchain_community.retrievers import BM25Retriever
 from langchain_core.documents import Document
 
+from src.domain.ports.embeddings import EmbeddingPort
 from src.domain.ports.vector_store import VectorStorePort
+from src.infrastructure.retrieval.semantic_cache import SemanticQueryCache
 
 
 # Default weights and constants
@@ -26,12 +30,17 @@ class HybridRetriever:
         vector_weight: float = VECTOR_WEIGHT,
         bm25_weight: float = BM25_WEIGHT,
         rrf_k: int = RRF_K,
+        embedding: EmbeddingPort | None = None,
+        semantic_cache: SemanticQueryCache | None = None,
     ):
         self._vector_store = vector_store
         self._vector_weight = vector_weight
         self._bm25_weight = bm25_weight
         self._rrf_k = rrf_k
         self._bm25_docs: list[Document] | None = None
+        # Paraphrased queries reuse earlier results (needs the query embedding)
+        self._embedding = embedding
+        self._semantic_cache = semantic_cache if embedding is not None else None
 
     def _get_bm25_docs(self) -> list[Document]:
         if self._bm25_docs is None:
@@ -76,22 +85,31 @@ class HybridRetriever:
     ) -> list[dict]:
         """Perform hybrid search combining vector + BM25."""
         fetch_k = min(num_results * 2, 20)
-        vector_results = self._vector_store.similarity_search(
-            query=query, k=fetch_k, filter=filter_dict,
-        )
+        if self._semantic_cache is not None:
+            query_vector = self._embedding.embed_query(query)
+            scope = (num_results, json.dumps(filter_dict, sort_keys=True))
+            cached = self._semantic_cache.lookup(query_vector, scope)
+            if cached is not None:
+                return [dict(d) for d in cached]
+            vector_results = self._vector_store.similarity_search_by_vector(
+                query_vector, k=fetch_k, filter=filter_dict,
+            )
+        else:
+            vector_results = self._vector_store.similarity_search(
+                query=query, k=fetch_k, filter=filter_dict,
+            )
 
         bm25_docs = self._get_bm25_docs()
         bm25_results: list[Document] = []
 
         if bm25_docs:
             if filter_dict:
-                allowed_companies: set[str] = set()
-                for cond in filter_dict.get("$or", []):
-                    if "company" in cond:
-                        allowed_companies.add(cond["company"])
+                allowed: set[tuple[str, str]] = {
+                    (key, value) for cond in filter_dict.get("$or", []) for key, value in cond.items()
+                }
                 filtered_docs = (
-                    [d for d in bm25_docs if d.metadata.get("company", "") in allowed_companies]
-                    if allowed_companies
+                    [d for d in bm25_docs if any(d.metadata.get(key) == value for key, value in allowed)]
+                    if allowed
                     else bm25_docs
                 )
             else:
@@ -122,4 +140,28 @@ class HybridRetriever:
                 "retrieval_method": retrieval_method,
             })
 
+        if self._semantic_cache is not None:
+            self._semantic_cache.store(query_vector, scope, [dict(d) for d in documents])
         return documents
+
+    def search_many(
+        self,
+        queries: list[str],
+        num_results: int = 5,
+        filter_dict: dict | None = None,
+        max_workers: int = 4,
+    ) -> list[list[dict]]:
+        """Run several hybrid searches in parallel.
+
+        Each query is embedded with ``embed_query`` (as in ``search``), so
+        asymmetric query/document models stay correct and the embedding
+        cache is shared with single searches. Results are returned in the
+        order of ``queries``.
+        """
+        if not queries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+            return list(executor.map(
+                lambda query: self.search(query, num_results, filter_dict),
+                queries,
+            ))
@@ -0,0 +1,59 @@
+"""Infrastructure — Semantic query cache (embedding similarity)."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Hashable
+
+import numpy as np
+
+
+class SemanticQueryCache:
+    """Serve retrieval results for near-duplicate queries.
+
+    Query embeddings are kept L2-normalised in one matrix, so a lookup is a
+    single matrix-vector product; the best cosine match at or above
+    ``threshold`` within the same scope (result count + filter) is a hit.
+    Oldest entries are evicted first once ``max_entries`` is reached.
+    """
+
+    def __init__(self, threshold: float = 0.98, max_entries: int = 256):
+        self._threshold = threshold
+        self._max_entries = max_entries
+        self._matrix: np.ndarray | None = None
+        self._scopes: list[Hashable] = []
+        self._results: list[Any] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalise(vector: list[float]) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
+
+    def lookup(self, vector: list[float], scope: Hashable) -> Any | None:
+        q = self._normalise(vector)
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != q.shape[0]:
+                return None
+            sims = self._matrix @ q
+            for idx in np.argsort(sims)[::-1]:
+                if sims[idx] < self._threshold:
+                    return None
+                if self._scopes[idx] == scope:
+                    return self._results[idx]
+        return None
+
+    def store(self, vector: list[float], scope: Hashable, result: Any) -> None:
+        q = self._normalise(vector)[np.newaxis, :]
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != q.shape[1]:
+                self._matrix, self._scopes, self._results = q, [scope], [result]
+                return
+            self._matrix = np.vstack((self._matrix[-(self._max_entries - 1):], q))
+            self._scopes = self._scopes[-(self._max_entries - 1):] + [scope]
+            self._results = self._results[-(self._max_entries - 1):] + [result]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matrix, self._scopes, self._results = None, [], []
@@ -10,6 +10,8 @@ from typing import Any
 
 import yaml
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL)
+
 
 @dataclass(frozen=True)
 class Skill:
@@ -29,7 +31,7 @@ class Skill:
 
 
 def _parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
         return {}, content
     frontmatter = yaml.safe_load(match.group(1)) or {}
@@ -37,9 +39,12 @@ def _parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
     return frontmatter, body
 
 
-@lru_cache(maxsize=16)
 def load_skill(skill_name: str, skills_dir: str | None = None) -> Skill:
-    """Load and parse a skill from the skills/ directory."""
+    """Load and parse a skill from the skills/ directory.
+
+    Parsed skills are cached per file modification time: repeated calls cost
+    one stat(), and edits to SKILL.md take effect without a restart.
+    """
     if skills_dir is None:
         skills_dir = os.path.join(
             os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
@@ -47,9 +52,15 @@ def load_skill(skill_name: str, skills_dir: str | None = None) -> Skill:
         )
 
     skill_path = os.path.join(skills_dir, skill_name, "SKILL.md")
-    if not os.path.isfile(skill_path):
-        raise FileNotFoundError(f"Skill not found: {skill_path}")
+    try:
+        mtime_ns = os.stat(skill_path).st_mtime_ns
+    except OSError:
+        raise FileNotFoundError(f"Skill not found: {skill_path}") from None
+    return _load_skill_file(skill_name, skill_path, mtime_ns)
 
+
+@lru_cache(maxsize=16)
+def _load_skill_file(skill_name: str, skill_path: str, mtime_ns: int) -> Skill:
     with open(skill_path, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -68,7 +79,11 @@ def load_skill(skill_name: str, skills_dir: str | None = None) -> Skill:
 
 
 def get_skill_prompt(skill_name: str, **kwargs: str) -> str:
-    """Convenience: load a skill and return its prompt with substitutions."""
+    """Convenience: load a skill and return its prompt with substitutions.
+
+    Shares load_skill's mtime-aware cache, so agent prompts and the
+    supervisor's skill pick up SKILL.md edits the same way.
+    """
     skill = load_skill(skill_name)
     return skill.prompt(**kwargs)
 
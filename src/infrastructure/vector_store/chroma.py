@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
-import glob
-import os
-import re
+import threading
 from typing import Any
 
 from langchain_chroma import Chroma
 from langchain_core.documents import Document
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from src.domain.ports.embeddings import EmbeddingPort
+from src.infrastructure.vector_store.pdf_loader import company_scope, length_sorted_batches, load_pdf_directory
+
+_SEED_BATCH_SIZE = 64
+
+# HNSW tuned for a small, rarely-updated corpus: a denser graph built once,
+# and a narrower beam at query time. Only applied when the collection is
+# created — Chroma does not allow changing these on an existing index.
+_HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
 
 
 class ChromaVectorStoreAdapter:
@@ -33,60 +42,59 @@ class ChromaVectorStoreAdapter:
         self._collection_name = collection_name
         self._docs_directory = docs_directory
         self._store: Chroma | None = None
+        self._init_lock = threading.Lock()
 
     def _get_store(self) -> Chroma:
-        if self._store is None:
-            self._store = Chroma(
-                collection_name=self._collection_name,
-                embedding_function=self._embedding,
-                persist_directory=self._persist_directory,
-            )
-            existing = self._store.get()
-            if len(existing.get("ids", [])) == 0 and self._docs_directory:
-                docs = self._load_local_docs()
-                if docs:
-                    self._store.add_documents(docs)
+        if self._store is not None:
+            return self._store
+        # Concurrent tool calls must not open two clients or seed twice
+        with self._init_lock:
+            if self._store is None:
+                self._store = self._open_store()
         return self._store
 
+    def _open_store(self) -> Chroma:
+        import chromadb
+
+        client = chromadb.PersistentClient(path=self._persist_directory)
+        existing_names = {getattr(c, "name", c) for c in client.list_collections()}
+        store = Chroma(
+            client=client,
+            collection_name=self._collection_name,
+            embedding_function=self._embedding,
+            collection_metadata=None if self._collection_name in existing_names else _HNSW_METADATA,
+        )
+        existing = store.get()
+        if len(existing.get("ids", [])) == 0 and self._docs_directory:
+            docs = self._load_local_docs()
+            for batch in length_sorted_batches(docs, _SEED_BATCH_SIZE):
+                store.add_documents(batch)
+        else:
+            self._backfill_company_scope(client.get_collection(self._collection_name), existing)
+        return store
+
+    def _backfill_company_scope(self, collection: Any, existing: dict) -> None:
+        """Tag chunks ingested before company_scope existed (metadata-only update)."""
+        ids, metadatas = [], []
+        for doc_id, meta in zip(existing.get("ids", []), existing.get("metadatas", [])):
+            if meta is not None and "company_scope" not in meta:
+                ids.append(doc_id)
+                metadatas.append({**meta, "company_scope": company_scope(meta.get("company", "Global"))})
+        if ids:
+            collection.update(ids=ids, metadatas=metadatas)
+
     def _load_local_docs(self) -> list[Document]:
         """Scan docs directory for PDFs, load and split into chunks."""
-        if not self._docs_directory:
-            return []
-
-        pdf_files = glob.glob(os.path.join(self._docs_directory, "*.pdf"))
-        if not pdf_files:
-            return []
-
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-        all_docs: list[Document] = []
-
-        for pdf_path in pdf_files:
-            try:
-                loader = PyPDFLoader(pdf_path)
-                docs = loader.load_and_split(text_splitter=splitter)
-
-                filename = os.path.basename(pdf_path)
-                company = "Global"
-                company_match = re.search(r"([A-Z][a-z]+)", filename)
-                if company_match:
-                    potential = company_match.group(1)
-                    if not any(kw in filename.lower() for kw in ["risks", "outlook", "wef", "fitch", "global"]):
-                        company = potential
-
-                for doc in docs:
-                    doc.metadata["source"] = filename
-                    doc.metadata["company"] = company
-                    doc.metadata["type"] = "pdf_report"
-
-                all_docs.extend(docs)
-            except Exception:
-                pass
-
-        return all_docs
+        return load_pdf_directory(self._docs_directory)
 
     def similarity_search(self, query: str, k: int = 5, filter: dict | None = None) -> list[Document]:
         return self._get_store().similarity_search(query=query, k=k, filter=filter)
 
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 5, filter: dict | None = None
+    ) -> list[Document]:
+        return self._get_store().similarity_search_by_vector(embedding=embedding, k=k, filter=filter)
+
     def add_documents(self, documents: list[Any]) -> None:
         self._get_store().add_documents(documents)
 
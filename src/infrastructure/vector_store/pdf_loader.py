@@ -0,0 +1,99 @@
+"""Infrastructure — PDF ingestion shared by the vector store adapters."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from langchain_core.documents import Document
+
+_COMPANY_NAME_RE = re.compile(r"([A-Z][a-z]+)")
+_BROAD_KEYWORDS = ("risks", "outlook", "wef", "fitch", "global")
+
+# Companies whose documents apply to every entity (macro / industry reports)
+BROAD_COMPANIES = frozenset({"Global", "General Risk", "Industry Report", "General"})
+BROAD_MACRO_SCOPE = "broad_macro"
+
+
+def company_scope(company: str) -> str:
+    """Normalised single-key filter value: the company, or the macro bucket.
+
+    Company names are lowercased, so filtering on ``company_scope`` is
+    case-insensitive ("Apple", "apple" and "APPLE" match the same chunks),
+    unlike the exact-match ``company`` metadata it replaces as a filter key.
+    """
+    return BROAD_MACRO_SCOPE if company in BROAD_COMPANIES else company.lower()
+
+
+def _company_for(filename: str) -> str:
+    company_match = _COMPANY_NAME_RE.search(filename)
+    if company_match and not any(kw in filename.lower() for kw in _BROAD_KEYWORDS):
+        return company_match.group(1)
+    return "Global"
+
+
+def _load_one(pdf_path: str) -> list[Document]:
+    """Load and split a single PDF (runs in a worker process)."""
+    from langchain_community.document_loaders import PyPDFLoader
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    try:
+        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+        docs = PyPDFLoader(pdf_path).load_and_split(text_splitter=splitter)
+    except Exception:
+        return []
+
+    filename = os.path.basename(pdf_path)
+    company = _company_for(filename)
+    for doc in docs:
+        doc.metadata["source"] = filename
+        doc.metadata["company"] = company
+        doc.metadata["type"] = "pdf_report"
+        doc.metadata["company_scope"] = company_scope(company)
+    return docs
+
+
+def length_sorted_batches(documents: list[Document], batch_size: int) -> Iterator[list[Document]]:
+    """Yield fixed-size batches of chunks with similar lengths.
+
+    Embedding models pad each batch to its longest input, so grouping chunks
+    of near-equal length wastes far fewer tokens on padding. Character count
+    is used as a provider-independent proxy for token count.
+    """
+    ordered = sorted(documents, key=lambda doc: len(doc.page_content))
+    for i in range(0, len(ordered), batch_size):
+        yield ordered[i:i + batch_size]
+
+
+def load_pdf_directory(docs_directory: str | None) -> list[Document]:
+    """Scan a directory for PDFs, load and split them into chunks.
+
+    PDF parsing is CPU-bound pure Python, so files are parsed in a process
+    pool; results keep the sorted file order. Workers are spawned, not
+    forked: this runs lazily from tool threads inside a multi-threaded
+    process (log, executor and server threads), where fork can deadlock.
+    """
+    if not docs_directory or not os.path.isdir(docs_directory):
+        return []
+
+    # scandir reuses the directory read's d_type, so no per-entry stat()
+    with os.scandir(docs_directory) as entries:
+        pdf_files = sorted(
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".pdf") and not entry.name.startswith(".") and entry.is_file()
+        )
+    if not pdf_files:
+        return []
+
+    workers = min(len(pdf_files), os.cpu_count() or 1)
+    if workers == 1:
+        per_file = [_load_one(path) for path in pdf_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            per_file = list(executor.map(_load_one, pdf_files))
+
+    return [doc for docs in per_file for doc in docs]
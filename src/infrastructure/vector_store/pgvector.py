@@ -11,20 +11,18 @@ Requires:
 
 from __future__ import annotations
 
-import glob
 import json
 import os
-import re
+import threading
 from typing import Any
 
 import psycopg
 from psycopg.rows import dict_row
 
 from langchain_core.documents import Document
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from src.domain.ports.embeddings import EmbeddingPort
+from src.infrastructure.vector_store.pdf_loader import BROAD_COMPANIES, BROAD_MACRO_SCOPE, length_sorted_batches, load_pdf_directory
 
 
 def _get_dsn() -> str:
@@ -50,6 +48,8 @@ class PgVectorStoreAdapter:
         self._table_name = table_name
         self._docs_directory = docs_directory
         self._initialized = False
+        # Re-entrant: seeding inside _ensure_table calls add_documents
+        self._init_lock = threading.RLock()
 
     def _detect_dimensions(self) -> int:
         """Detect embedding dimensions by running a test embedding."""
@@ -59,7 +59,11 @@ class PgVectorStoreAdapter:
     def _ensure_table(self) -> None:
         if self._initialized:
             return
+        with self._init_lock:
+            if not self._initialized:
+                self._create_and_seed()
 
+    def _create_and_seed(self) -> None:
         dims = self._detect_dimensions()
 
         with psycopg.connect(self._dsn) as conn:
@@ -95,6 +99,23 @@ class PgVectorStoreAdapter:
                 ON {self._table_name}
                 USING hnsw (embedding vector_cosine_ops)
             """)
+            # Company filter key: backfill rows ingested before it existed, and index it
+            conn.execute(
+                f"""
+                UPDATE {self._table_name}
+                SET metadata = metadata || jsonb_build_object(
+                    'company_scope',
+                    CASE WHEN metadata->>'company' = ANY(%s) THEN %s
+                         ELSE lower(COALESCE(metadata->>'company', 'global')) END
+                )
+                WHERE NOT (metadata ? 'company_scope')
+                """,
+                (sorted(BROAD_COMPANIES), BROAD_MACRO_SCOPE),
+            )
+            conn.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{self._table_name}_company_scope
+                ON {self._table_name} ((metadata->>'company_scope'))
+            """)
             conn.commit()
 
         self._initialized = True
@@ -113,52 +134,16 @@ class PgVectorStoreAdapter:
 
     def _load_local_docs(self) -> list[Document]:
         """Scan docs directory for PDFs, load and split into chunks."""
-        if not self._docs_directory:
-            return []
-
-        pdf_files = glob.glob(os.path.join(self._docs_directory, "*.pdf"))
-        if not pdf_files:
-            return []
-
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
-        all_docs: list[Document] = []
-
-        for pdf_path in pdf_files:
-            try:
-                loader = PyPDFLoader(pdf_path)
-                docs = loader.load_and_split(text_splitter=splitter)
-
-                filename = os.path.basename(pdf_path)
-                company = "Global"
-                company_match = re.search(r"([A-Z][a-z]+)", filename)
-                if company_match:
-                    potential = company_match.group(1)
-                    if not any(kw in filename.lower() for kw in ["risks", "outlook", "wef", "fitch", "global"]):
-                        company = potential
-
-                for doc in docs:
-                    doc.metadata["source"] = filename
-                    doc.metadata["company"] = company
-                    doc.metadata["type"] = "pdf_report"
-
-                all_docs.extend(docs)
-            except Exception:
-                pass
-
-        return all_docs
+        return load_pdf_directory(self._docs_directory)
 
     def add_documents(self, documents: list[Any]) -> None:
         """Embed and insert documents into pgvector."""
         self._ensure_table()
 
-        texts = [doc.page_content for doc in documents]
-        metadatas = [doc.metadata if hasattr(doc, "metadata") else {} for doc in documents]
-
-        # Batch embed
-        batch_size = 50
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i:i + batch_size]
-            batch_meta = metadatas[i:i + batch_size]
+        # Batch embed, grouping chunks of similar length to minimise padding
+        for batch in length_sorted_batches(documents, 50):
+            batch_texts = [doc.page_content for doc in batch]
+            batch_meta = [doc.metadata if hasattr(doc, "metadata") else {} for doc in batch]
             embeddings = self._embedding.embed_documents(batch_texts)
 
             with psycopg.connect(self._dsn) as conn:
@@ -172,8 +157,14 @@ class PgVectorStoreAdapter:
     def similarity_search(self, query: str, k: int = 5, filter: dict | None = None) -> list[Document]:
         """Search by cosine similarity using pgvector <=> operator."""
         self._ensure_table()
+        return self.similarity_search_by_vector(self._embedding.embed_query(query), k=k, filter=filter)
 
-        query_embedding = self._embedding.embed_query(query)
+    def similarity_search_by_vector(
+        self, embedding: list[float], k: int = 5, filter: dict | None = None
+    ) -> list[Document]:
+        """Same as similarity_search, for a precomputed query embedding."""
+        self._ensure_table()
+        query_embedding = embedding
 
         # Build WHERE clause from filter
         where_clause = ""
@@ -11,34 +11,68 @@ Usage:
     python -m src.main                          # Default demo query
     python -m src.main "Assess risk for TSLA"   # Custom query
     python -m src.main --redis                  # Force Redis backend
+    python -m src.main --resume                 # Resume/replay today's run of the same query
 """
 
 from __future__ import annotations
 
 import asyncio
+import copy
+import hashlib
 import json
 import os
 import sys
 import time
 import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
 
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage
 from loguru import logger
+from pydantic_core import from_json
 
 load_dotenv()
 
 
 # ── Default analysis queries ──────────────────────────────────────────
-DEFAULT_QUERIES = [
+DEFAULT_QUERIES: tuple[str, ...] = (
     (
         "Perform a comprehensive credit and geopolitical risk assessment for "
         "Apple Inc. (AAPL), considering its supply chain exposure to China and "
         "Taiwan, the current US-China semiconductor tensions, and its financial "
         "health. Provide an integrated risk report with quantified risk scores."
     ),
-]
+)
+
+
+# ── Result cache (identical query → reuse the finished report) ────────
+_RESULT_CACHE_TTL = float(os.getenv("ANALYSIS_CACHE_TTL", "3600"))  # seconds; 0 disables
+_RESULT_CACHE_MAX_ENTRIES = 50
+_result_cache: OrderedDict[tuple[str, str, bool], tuple[float, dict]] = OrderedDict()
+
+
+def _cache_get(key: tuple[str, str, bool]) -> dict | None:
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > _RESULT_CACHE_TTL:
+        del _result_cache[key]
+        return None
+    _result_cache.move_to_end(key)
+    # Callers own what they receive: never hand out the cached object itself
+    return {**copy.deepcopy(result), "cached": True}
+
+
+def _cache_put(key: tuple[str, str, bool], result: dict) -> None:
+    if _RESULT_CACHE_TTL <= 0:
+        return
+    _result_cache[key] = (time.monotonic(), copy.deepcopy(result))
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+        _result_cache.popitem(last=False)
 
 
 def _print_banner():
@@ -55,15 +89,73 @@ async def run_analysis(
     use_redis: bool = False,
     thread_id: str | None = None,
     langfuse_handler: object | None = None,
+    resume: bool | None = None,
 ) -> tuple[str, dict, list, dict | None]:
     """Execute a full multi-agent risk analysis."""
+    result: dict | None = None
+    async for event in run_analysis_stream(query, use_redis, thread_id, langfuse_handler, resume):
+        if event["type"] == "result":
+            result = event
+    if result is None:
+        raise RuntimeError("Analysis stream ended without a result")
+    return result["report"], result["sources"], result["token_usage"], result["structured_report"]
+
+
+async def run_analysis_stream(
+    query: str,
+    use_redis: bool = False,
+    thread_id: str | None = None,
+    langfuse_handler: object | None = None,
+    resume: bool | None = None,
+) -> AsyncIterator[dict]:
+    """Execute a full multi-agent risk analysis, yielding progress events.
+
+    Yields one ``{"type": "node", ...}`` event per completed graph step,
+    ``{"type": "token", ...}`` events as the market synthesizer writes the
+    report, then a single ``{"type": "result", ...}`` event carrying the report,
+    sources, token usage and structured report. Results for an identical
+    (query, model, backend) are served from memory for ANALYSIS_CACHE_TTL
+    seconds; such a result carries ``"cached": True``.
+
+    With ``resume`` (default: ANALYSIS_RESUME env), checkpointed state for the
+    thread is reused: an interrupted run continues and a finished one is
+    replayed. Without a ``thread_id`` the thread is then derived from
+    (day, model, query); otherwise every run gets a fresh thread.
+    """
+    if resume is None:
+        resume = os.getenv("ANALYSIS_RESUME", "false").lower() == "true"
+
+    cache_key = (query, os.getenv("OLLAMA_MODEL", "qwen3.5"), use_redis)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"Query: {query[:100]}... (served from result cache)")
+        yield cached
+        return
+
+    async for event in _run_pipeline(query, use_redis, thread_id, langfuse_handler, resume):
+        if event["type"] == "result" and event["report"] and event["structured_report"]:
+            _cache_put(cache_key, event)
+        yield event
+
+
+async def _run_pipeline(
+    query: str,
+    use_redis: bool,
+    thread_id: str | None,
+    langfuse_handler: object | None,
+    resume: bool,
+) -> AsyncIterator[dict]:
+    """Build the graph on the selected checkpointer backend and stream it."""
     from src.container import bootstrap
     from src.application.graph import build_graph
 
     # Bootstrap DI container (idempotent)
     bootstrap()
 
-    thread_id = thread_id or str(uuid.uuid4())
+    if thread_id is None:
+        # Resuming: the same query on the same day maps to the same thread, so a
+        # rerun continues (or replays) it from the persistent checkpointer.
+        thread_id = _query_thread_id(query) if resume else str(uuid.uuid4())
 
     initial_state = {
         "messages": [HumanMessage(content=query)],
@@ -74,15 +166,16 @@ async def run_analysis(
         "structured_report": None,
         "iteration_count": 0,
         "token_usage": [],
+        "allow_self_correction": os.getenv("SUPERVISOR_SELF_CORRECTION", "false").lower() == "true",
     }
     config = {"configurable": {"thread_id": thread_id}}
 
-    redis_cm = None
+    redis_saver = None
 
     if use_redis:
         try:
-            from src.infrastructure.persistence.redis import get_redis_checkpointer
-            redis_cm = get_redis_checkpointer()
+            from src.infrastructure.persistence.redis import get_redis_saver
+            redis_saver = await get_redis_saver()
         except ImportError:
             logger.warning("langgraph-checkpoint-redis not installed. Using in-memory state.")
         except Exception as e:
@@ -94,42 +187,203 @@ async def run_analysis(
             else:
                 logger.warning(f"Redis connection failed ({e}). Falling back to in-memory state.")
 
-    if use_redis and redis_cm is not None:
+    if redis_saver is not None:
         try:
-            async with redis_cm as checkpointer:
-                graph = build_graph(checkpointer=checkpointer)
-                logger.info(f"Query: {query[:100]}...")
-                logger.info(f"Thread ID: {thread_id}")
-                logger.info("State Backend: Redis")
-                return await _execute_graph(graph, initial_state, config, langfuse_handler)
+            graph = build_graph(checkpointer=redis_saver)
+            logger.info(f"Query: {query[:100]}...")
+            logger.info(f"Thread ID: {thread_id}")
+            logger.info("State Backend: Redis")
+            async for event in _stream_graph(graph, initial_state, config, langfuse_handler, resume):
+                yield event
+            return
         except Exception as e:
-            logger.warning(f"Redis failed ({e}). Falling back to in-memory state.")
+            logger.warning(f"Redis failed ({e}). Falling back to local state.")
 
-    # In-memory fallback
-    from langgraph.checkpoint.memory import MemorySaver
-    checkpointer = MemorySaver()
+    # Local fallback: in-memory for one-off threads; a SQLite file (survives
+    # restarts) only when the thread may be resumed, since nothing else reads
+    # or prunes those checkpoints.
+    checkpointer = None
+    if resume:
+        try:
+            from src.infrastructure.persistence.sqlite import get_sqlite_saver
+            checkpointer = await get_sqlite_saver()
+            backend_label = "SQLite"
+        except ImportError:
+            logger.warning(
+                "Resume requested but langgraph-checkpoint-sqlite is not installed. "
+                "Using in-memory state: this run cannot be resumed or replayed."
+            )
+        except Exception as e:
+            logger.warning(f"SQLite checkpointer unavailable ({e}). Using in-memory state.")
+    if checkpointer is None:
+        from langgraph.checkpoint.memory import MemorySaver
+        checkpointer = MemorySaver()
+        backend_label = "In-Memory"
+    if use_redis:
+        backend_label += " (Redis failed)"
     graph = build_graph(checkpointer=checkpointer)
-    backend_label = "In-Memory (Redis failed)" if use_redis else "In-Memory"
     logger.info(f"Query: {query[:100]}...")
     logger.info(f"Thread ID: {thread_id}")
     logger.info(f"State Backend: {backend_label}")
-    return await _execute_graph(graph, initial_state, config, langfuse_handler)
+    async for event in _stream_graph(graph, initial_state, config, langfuse_handler, resume):
+        yield event
 
 
-async def _execute_graph(graph, initial_state, config, langfuse_handler=None):
-    """Run the graph and extract report + sources."""
+def _query_thread_id(query: str) -> str:
+    """Deterministic thread id for (day, model, query)."""
+    model = os.getenv("OLLAMA_MODEL", "qwen3.5")
+    digest = hashlib.sha256(f"{datetime.now():%Y-%m-%d}|{model}|{query}".encode()).hexdigest()
+    return f"query-{digest[:32]}"
+
+
+async def _fresh_thread(graph, config: dict) -> dict:
+    """Drop a thread's checkpoints; if the saver cannot, move to a new thread id."""
+    thread_id = config["configurable"]["thread_id"]
+    try:
+        await graph.checkpointer.adelete_thread(thread_id)
+        return config
+    except Exception as e:
+        new_id = f"{thread_id}-{uuid.uuid4().hex[:8]}"
+        logger.warning(f"Could not clear thread {thread_id} ({e}); continuing on {new_id}")
+        return {**config, "configurable": {**config["configurable"], "thread_id": new_id}}
+
+
+# ── Source extraction (tool outputs → report sources) ──────────────
+
+def _news_sources(data: dict) -> Iterator[tuple[str, dict]]:
+    for article in data["articles"]:
+        entry = {
+            "title": article.get("title", ""),
+            "url": article.get("url", ""),
+            "source": article.get("source", ""),
+            "date": article.get("date", ""),
+        }
+        if entry["title"]:
+            yield "news", entry
+
+
+def _web_sources(data: dict) -> Iterator[tuple[str, dict]]:
+    for result in data["results"]:
+        entry = {
+            "title": result.get("title", ""),
+            "url": result.get("href", ""),
+            "source": "Web",
+            "date": result.get("published_date", "") or result.get("date", ""),
+        }
+        if entry["title"]:
+            yield "news", entry
+
+
+def _market_sources(data: dict) -> Iterator[tuple[str, dict]]:
+    snapshot = data.get("market_snapshot") or {}
+    entry = {
+        "company": data.get("company") or snapshot.get("name", ""),
+        "ticker": data.get("ticker") or snapshot.get("ticker", ""),
+        "price": snapshot.get("current_price", ""),
+        "pe_ratio": data.get("financial_ratios", {}).get("pe_ratio") or snapshot.get("pe_ratio_trailing", ""),
+    }
+    if entry["company"]:
+        yield "market", entry
+
+
+def _market_batch_sources(data: dict) -> Iterator[tuple[str, dict]]:
+    for ticker, peer in (data.get("tickers") or {}).items():
+        if peer.get("error") or not peer.get("recent_prices"):
+            continue
+        yield "market", {
+            "company": ticker,
+            "ticker": ticker,
+            "price": peer["recent_prices"][-1].get("close", ""),
+            "pe_ratio": "",
+        }
+
+
+def _rag_sources(data: dict) -> Iterator[tuple[str, dict]]:
+    for doc in data["documents"]:
+        entry = {
+            "source": doc.get("source", ""),
+            "company": doc.get("company", ""),
+            "type": doc.get("document_type", ""),
+            "score": doc.get("relevance_score", 0),
+            "content": doc.get("content", ""),
+        }
+        if entry["source"]:
+            yield "rag", entry
+
+
+def _rag_batch_sources(data: dict) -> Iterator[tuple[str, dict]]:
+    for search in data["searches"]:
+        yield from _rag_sources(search)
+
+
+# First matching key wins, so order matters ("articles" before "results")
+_SOURCE_HANDLERS = {
+    "articles": _news_sources,
+    "searches": _rag_batch_sources,
+    "results": _web_sources,
+    "market_snapshot": _market_sources,
+    "tickers": _market_batch_sources,
+    "company": _market_sources,
+    "documents": _rag_sources,
+}
+
+
+# Fields that identify a source; other fields (scores, dates) may differ between repeats
+_SOURCE_IDENTITY = {
+    "news": ("url", "title"),
+    "market": ("ticker", "company"),
+    "rag": ("source", "content"),
+}
+
+
+# Nodes whose LLM tokens are forwarded as they are generated (the final report)
+_TOKEN_STREAM_NODES = frozenset({"market_synthesizer"})
+
+
+async def _stream_graph(graph, initial_state, config, langfuse_handler=None, resume=False) -> AsyncIterator[dict]:
+    """Run the graph, yielding one event per node, then the extracted report + sources."""
     from src.domain.services.report_builder import extract_text
     from langchain_core.messages import ToolMessage as _ToolMessage
 
     start_time = time.time()
 
+    # Existing checkpoint for this thread: resume an interrupted run, or replay a
+    # finished one without re-running any node (input None = continue from state).
+    # A finished run that produced no report is discarded and started over.
+    graph_input = initial_state
+    if resume:
+        snapshot = await graph.aget_state(config)
+        if snapshot and snapshot.values:
+            if snapshot.next:
+                graph_input = None
+                logger.info("Checkpoint found — resuming interrupted run")
+            elif snapshot.values.get("final_report"):
+                graph_input = None
+                logger.info("Checkpoint found — replaying finished run")
+            else:
+                logger.info("Checkpoint found without a report — starting over")
+                config = await _fresh_thread(graph, config)
+
     from src.infrastructure.observability.langfuse_tracer import build_langfuse_config
     thread_id = config.get("configurable", {}).get("thread_id")
     model = os.getenv("OLLAMA_MODEL", "unknown")
     stream_config = build_langfuse_config(config, session_id=thread_id, handler=langfuse_handler, model=model)
 
-    async for event in graph.astream(initial_state, config=stream_config):
+    async for mode, event in graph.astream(graph_input, config=stream_config, stream_mode=["updates", "messages"]):
+        if mode == "messages":
+            chunk, metadata = event
+            # Best effort: drops tool-call chunks, not text sent before them
+            if metadata.get("langgraph_node") in _TOKEN_STREAM_NODES and not getattr(chunk, "tool_call_chunks", None):
+                text = extract_text(chunk.content)
+                if text:
+                    yield {"type": "token", "node": metadata["langgraph_node"], "text": text}
+            continue
+
         for node_name, node_output in event.items():
+            if node_name.startswith("__"):
+                # LangGraph bookkeeping (e.g. "__metadata__"), not a pipeline stage
+                continue
+            node_output = node_output or {}
             elapsed = time.time() - start_time
             logger.info(f"[{elapsed:.1f}s] Node: {node_name}")
 
@@ -143,6 +397,15 @@ async def _execute_graph(graph, initial_state, config, langfuse_handler=None):
             if "next_agent" in node_output:
                 logger.info(f"Next: {node_output['next_agent']}")
 
+            usage = node_output.get("token_usage") or []
+            yield {
+                "type": "node",
+                "node": node_name,
+                "elapsed": round(elapsed, 1),
+                "seconds": usage[0].get("seconds") if usage else None,
+                "next_agent": node_output.get("next_agent"),
+            }
+
     elapsed = time.time() - start_time
     logger.info("=" * 70)
     logger.info(f"Analysis completed in {elapsed:.1f} seconds")
@@ -177,73 +440,34 @@ async def _execute_graph(graph, initial_state, config, langfuse_handler=None):
                             if final_report:
                                 break
 
+            seen: dict[str, set[tuple]] = {"news": set(), "market": set(), "rag": set()}
             for msg in messages:
                 if not isinstance(msg, _ToolMessage):
                     continue
                 try:
-                    data = json.loads(msg.content)
-                except (json.JSONDecodeError, TypeError):
+                    # pydantic-core's Rust parser: the tool payloads are large JSON blobs
+                    data = from_json(msg.content)
+                except (ValueError, TypeError):
+                    continue
+                if not isinstance(data, dict):
                     continue
 
-                if "articles" in data:
-                    for article in data["articles"]:
-                        entry = {
-                            "title": article.get("title", ""),
-                            "url": article.get("url", ""),
-                            "source": article.get("source", ""),
-                            "date": article.get("date", ""),
-                        }
-                        if entry["title"] and entry not in sources["news"]:
-                            # Compute RL Score
-                            try:
-                                base_score = get_source_feedback_score(entry["url"])
-                                rl_weight = compute_rl_weight(base_score, entry["date"])
-                                entry["score"] = rl_weight
-                            except Exception:
-                                pass
-                            sources["news"].append(entry)
-
-                elif "results" in data and "articles" not in data:
-                    for result in data["results"]:
-                        date_val = result.get("published_date", "")
-                        if not date_val:
-                            date_val = result.get("date", "")
-                        entry = {
-                            "title": result.get("title", ""),
-                            "url": result.get("href", ""),
-                            "source": "Web",
-                            "date": date_val,
-                        }
-                        if entry["title"] and entry not in sources["news"]:
-                            try:
-                                base_score = get_source_feedback_score(entry["url"])
-                                rl_weight = compute_rl_weight(base_score, entry["date"])
-                                entry["score"] = rl_weight
-                            except Exception:
-                                pass
-                            sources["news"].append(entry)
-
-                elif "market_snapshot" in data or "company" in data:
-                    entry = {
-                        "company": data.get("company", ""),
-                        "ticker": data.get("ticker", ""),
-                        "price": data.get("market_snapshot", {}).get("current_price", ""),
-                        "pe_ratio": data.get("financial_ratios", {}).get("pe_ratio", ""),
-                    }
-                    if entry["company"] and entry not in sources["market"]:
-                        sources["market"].append(entry)
-
-                elif "documents" in data:
-                    for doc in data["documents"]:
-                        entry = {
-                            "source": doc.get("source", ""),
-                            "company": doc.get("company", ""),
-                            "type": doc.get("document_type", ""),
-                            "score": doc.get("relevance_score", 0),
-                            "content": doc.get("content", ""),
-                        }
-                        if entry["source"] and entry not in sources["rag"]:
-                            sources["rag"].append(entry)
+                handler = next((h for key, h in _SOURCE_HANDLERS.items() if key in data), None)
+                if handler is None:
+                    continue
+                for category, entry in handler(data):
+                    dedup_key = tuple(entry.get(field) for field in _SOURCE_IDENTITY[category])
+                    if dedup_key in seen[category]:
+                        continue
+                    seen[category].add(dedup_key)
+                    if category == "news":
+                        # Compute RL Score
+                        try:
+                            base_score = get_source_feedback_score(entry["url"])
+                            entry["score"] = compute_rl_weight(base_score, entry["date"])
+                        except Exception:
+                            pass
+                    sources[category].append(entry)
 
             # Sort by score descending and limit to 10
             if sources["news"]:
@@ -264,14 +488,25 @@ async def _execute_graph(graph, initial_state, config, langfuse_handler=None):
         from src.domain.models.risk_report import parse_report_to_structured
         structured_report = parse_report_to_structured(final_report).model_dump()
 
-    return final_report, sources, token_usage, structured_report
+    yield {
+        "type": "result",
+        "report": final_report,
+        "sources": sources,
+        "token_usage": token_usage,
+        "structured_report": structured_report,
+        "thread_id": thread_id,
+    }
 
 
 async def main():
     """Main entry point."""
+    from src.infrastructure.observability.log_sink import configure_logging
+
+    configure_logging()
     _print_banner()
 
     use_redis = "--redis" in sys.argv
+    resume = True if "--resume" in sys.argv else None
     custom_query = None
     for arg in sys.argv[1:]:
         if not arg.startswith("--"):
@@ -281,7 +516,32 @@ async def main():
     query = custom_query or DEFAULT_QUERIES[0]
 
     logger.info("Initializing agents...")
-    report, sources, token_usage, structured_report = await run_analysis(query=query, use_redis=use_redis)
+    result: dict | None = None
+    streamed = False
+    try:
+        async for event in run_analysis_stream(query=query, use_redis=use_redis, resume=resume):
+            if event["type"] == "token":
+                # Live preview only: it may include preamble, tool-turn text or a
+                # retried partial answer. The final report is printed below.
+                if not streamed:
+                    logger.info("Live preview of the report (final version follows):")
+                    streamed = True
+                sys.stdout.write(event["text"])
+                sys.stdout.flush()
+            elif event["type"] == "result":
+                result = event
+    finally:
+        from src.infrastructure.persistence.sqlite import close_sqlite_saver
+        await close_sqlite_saver()
+        if use_redis:
+            from src.infrastructure.persistence.redis import close_redis_saver
+            await close_redis_saver()
+    if result is None:
+        raise RuntimeError("Analysis stream ended without a result")
+    report, sources, token_usage = result["report"], result["sources"], result["token_usage"]
+
+    if streamed:
+        sys.stdout.write("\n")
 
     logger.info("=" * 70)
     logger.info("  FINAL INTEGRATED RISK REPORT")
@@ -298,25 +558,32 @@ async def main():
         saved = total_cached * 0.27 / 1_000_000
         logger.info("  TOKEN USAGE")
         for t in token_usage:
-            logger.info(f"     {t['agent']:25s} | {t['input']:,} in | {t['output']:,} out | {t.get('cached', 0):,} cached")
+            logger.info(
+                f"     {t['agent']:25s} | {t['input']:,} in | {t['output']:,} out | "
+                f"{t.get('cached', 0):,} cached | {t.get('seconds', 0):.1f}s"
+            )
         logger.info(f"     {'TOTAL':25s} | {total_in:,} in | {total_out:,} out | {total_cached:,} cached")
         logger.info(f"  ESTIMATED COST: ${cost_in + cost_out:.4f} (saved ${saved:.4f} via caching)")
         logger.info("=" * 70)
 
     output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
     os.makedirs(output_dir, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = os.path.join(output_dir, f"risk_report_{timestamp}.md")
-    with open(output_path, "w") as f:
-        f.write(f"# Risk Assessment Report\n")
-        f.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"**Query**: {query}\n\n")
-        f.write("---\n\n")
-        f.write(report)
-        f.write("\n\n---\n")
-        f.write("<!-- INTERNAL_METADATA_START\n")
-        f.write(json.dumps({"sources": sources}, indent=2))
-        f.write("\nINTERNAL_METADATA_END -->\n")
+    generated_at = datetime.now()
+    output_path = os.path.join(output_dir, f"risk_report_{generated_at:%Y%m%d_%H%M%S}.md")
+    body = (
+        f"# Risk Assessment Report\n"
+        f"**Generated**: {generated_at:%Y-%m-%d %H:%M:%S}\n"
+        f"**Query**: {query}\n\n"
+        "---\n\n"
+        f"{report}"
+        "\n\n---\n"
+        "<!-- INTERNAL_METADATA_START\n"
+        f"{json.dumps({'sources': sources}, indent=2)}"
+        "\nINTERNAL_METADATA_END -->\n"
+    )
+    # One encoded write instead of nine through the text layer
+    with open(output_path, "wb") as f:
+        f.write(body.encode("utf-8"))
 
     logger.info(f"Report saved to: {output_path}")
 
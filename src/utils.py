@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import random
+import re
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -16,6 +17,8 @@ from loguru import logger
 
 T = TypeVar("T")
 
+_RATE_LIMIT_RE = re.compile(r"429|resource_exhausted|rate limit|quota", re.IGNORECASE)
+
 
 class RateLimitError(Exception):
     """Raised when API rate limit is hit."""
@@ -37,8 +40,9 @@ async def retry_with_backoff(
         func: Async callable to execute.
         max_retries: Maximum number of retry attempts.
         base_delay: Initial delay in seconds between retries.
-        max_delay: Maximum delay cap in seconds.
-        jitter: Add random jitter to prevent thundering herd.
+        max_delay: Maximum delay cap in seconds (applied after jitter).
+        jitter: Scale each delay by a random factor in [0.5, 1.5) so concurrent
+            callers that hit the same rate limit do not retry in lockstep.
 
     Returns:
         The result of the successful function call.
@@ -52,19 +56,16 @@ async def retry_with_backoff(
         try:
             return await func(*args, **kwargs)
         except Exception as e:
-            error_str = str(e).lower()
-            is_rate_limit = any(
-                keyword in error_str
-                for keyword in ["429", "resource_exhausted", "rate limit", "quota"]
-            )
+            is_rate_limit = _RATE_LIMIT_RE.search(str(e)) is not None
 
             if not is_rate_limit or attempt >= max_retries:
                 raise
 
             last_exception = e
-            delay = min(base_delay * (2 ** attempt), max_delay)
+            delay = base_delay * (2 ** attempt)
             if jitter:
-                delay += random.uniform(0, delay * 0.3)
+                delay *= random.uniform(0.5, 1.5)
+            delay = min(delay, max_delay)
 
             logger.warning(
                 f"Rate limit hit (attempt {attempt + 1}/{max_retries + 1}). "